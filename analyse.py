@@ -2,18 +2,32 @@ import requests
 import json
 import logging
 import time
+import copy
+import threading
+import queue
+import atexit
 import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
-from bs4 import BeautifulSoup
-from rapidfuzz import fuzz
-from urllib.parse import urlparse, urljoin
+import sqlite3
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Mapping
+from types import MappingProxyType
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+from rapidfuzz import fuzz, process
+from urllib.parse import urlparse, urljoin, urlunparse, urlencode, parse_qsl
 import asyncio
 from debug_helper import debug
 import random
 import base64
 import hashlib
+import heapq
+from operator import itemgetter
+from functools import lru_cache
+from statistics import fmean
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from requests.adapters import HTTPAdapter
+import urllib3
 from urllib3.util.retry import Retry
 
 # Configure logging first
@@ -41,10 +55,64 @@ except Exception as e:
     SELENIUM_AVAILABLE = False
     logger.warning(f"Selenium setup failed - fallback to requests only: {e}")
 
+# Prefer the C-based lxml parser for BeautifulSoup, fall back to the stdlib parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    logger.warning("lxml not available - using slower html.parser")
+
+def make_soup(markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML with BeautifulSoup using the preferred parser."""
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=parse_only)
+
+# Selectolax (Lexbor) is a much faster parser for plain CSS selector matching
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    logger.warning("selectolax not available - pattern matching uses BeautifulSoup")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available - using the standard json module")
+
+# OpenAI imports with error handling
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError as e:
+    OPENAI_AVAILABLE = False
+    logger.warning(f"OpenAI SDK not available - AI explanations disabled: {e}")
+
+# httpx is also the OpenAI SDK's transport, so it is importable whenever openai is;
+# only HTTP/2 needs the extra h2 package
+try:
+    import httpx
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+    logger.warning("httpx HTTP/2 support not available - AH API probing uses requests")
+
 # Load configuration files
+def load_json_file(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def decode_json_response(response) -> Any:
+    """Decode a JSON HTTP response body, using orjson when it is installed."""
+    return orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+
 try:
-    with open("config.json", encoding="utf-8") as f:
-        CONFIG = json.load(f)
+    CONFIG = load_json_file("config.json")
     logger.info("Configuration loaded successfully")
 except FileNotFoundError:
     CONFIG = {
@@ -55,46 +123,238 @@ except FileNotFoundError:
     logger.warning("Config file not found, using defaults")
 
 try:
-    with open("substitutions.json", encoding="utf-8") as f:
-        SUBSTITUTIONS = json.load(f)
+    SUBSTITUTIONS = load_json_file("substitutions.json")
     logger.info("Substitutions database loaded successfully")
 except FileNotFoundError:
     SUBSTITUTIONS = {}
     logger.warning("Substitutions file not found")
 
-def smart_ingredient_scraping(url: str) -> Tuple[List[str], str]:
+# Standard health goals with their default scores, in display order
+_STANDARD_GOALS: Tuple[Tuple[str, int], ...] = (
+    ("Algemene gezondheid", 5),
+    ("Hart- en vaatziekten", 5),
+    ("Diabetes preventie", 5),
+    ("Gewichtsbeheersing", 5),
+    ("Spijsvertering", 5),
+    ("Immuunsysteem", 5),
+    ("Botgezondheid", 5),
+    ("Energieniveau", 5),
+    ("Huidgezondheid", 5),
+    ("Hersengezondheid", 5),
+)
+_STANDARD_GOALS_DICT: Dict[str, int] = dict(_STANDARD_GOALS)
+_PRIMARY_GOAL = _STANDARD_GOALS[0][0]
+
+# Weights for each health goal in the overall health score
+_GOAL_WEIGHTS: Dict[str, float] = {
+    "Algemene gezondheid": 0.25,
+    "Hart- en vaatziekten": 0.15,
+    "Diabetes preventie": 0.15,
+    "Gewichtsbeheersing": 0.10,
+    "Spijsvertering": 0.05,
+    "Immuunsysteem": 0.05,
+    "Botgezondheid": 0.05,
+    "Energieniveau": 0.10,
+    "Huidgezondheid": 0.05,
+    "Hersengezondheid": 0.05
+}
+_GOAL_WEIGHTS_TOTAL = sum(_GOAL_WEIGHTS.values())
+
+# Minimum number of ingredients needed for a meaningful analysis
+_MIN_INGREDIENTS = CONFIG.get("analysis", {}).get("min_ingredients_required", 3)
+
+class TTLCache:
+    """Thread-safe in-memory LRU cache whose entries expire after a fixed time."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored for key if it is still fresh, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def store(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+# In-memory cache of complete analysis results, keyed by URL or text hash
+_ANALYSIS_CACHE = TTLCache(
+    CONFIG.get("analysis", {}).get("result_cache_ttl_seconds", 3600),
+    CONFIG.get("analysis", {}).get("result_cache_max_entries", 512)
+)
+
+# Scraped ingredients per canonical recipe URL, so re-analysing a page skips the download
+_SCRAPE_CACHE = TTLCache(
+    CONFIG.get("analysis", {}).get("scrape_cache_ttl_seconds", 3600),
+    CONFIG.get("analysis", {}).get("scrape_cache_max_entries", 256)
+)
+
+# Shared OpenAI client so all calls reuse one keep-alive connection pool
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+def get_openai_client():
+    """Return the shared OpenAI client, creating it on first use."""
+    global _openai_client
+
+    if _openai_client is not None:
+        return _openai_client
+
+    if not OPENAI_AVAILABLE:
+        raise Exception("OpenAI SDK niet beschikbaar")
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise Exception("OpenAI API key niet gevonden - stel OPENAI_API_KEY in bij Secrets")
+
+    with _openai_client_lock:
+        if _openai_client is None:
+            _openai_client = openai.OpenAI(
+                api_key=api_key,
+                http_client=httpx.Client(
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                    timeout=20.0
+                )
+            )
+    return _openai_client
+
+def compile_keyword_matcher(keywords) -> re.Pattern:
+    """
+    Compile keywords into one case-insensitive alternation of literals.
+
+    A single search() finds whether any keyword occurs as a substring, so
+    callers scan the text once instead of once per keyword. Longer keywords
+    come first so the reported match is the most specific one.
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(keyword) for keyword in ordered), re.IGNORECASE)
+
+def create_pooled_session() -> requests.Session:
+    """Create a session with a pooled keep-alive adapter and light retries."""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+# Shared session so scraping attempts and nutrition API lookups reuse open TCP/TLS connections
+HTTP_SESSION = create_pooled_session()
+
+# Query parameters that only track the visitor and never change the recipe page
+_TRACKING_QUERY_PREFIXES = ('utm_', 'fbclid', 'gclid', 'mc_', '_ga')
+
+def canonicalize_recipe_url(url: str) -> str:
+    """Normalize a recipe URL for caching: lowercase host, no fragment or tracking parameters."""
+    parsed = urlparse(url.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_QUERY_PREFIXES)
+    ])
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path or '/', parsed.params, query, ''))
+
+def smart_ingredient_scraping(url: str, refresh: bool = False) -> Tuple[List[str], str]:
     """
     Smart ingredient scraping with multiple fallback methods.
 
+    Successful results are cached per canonical URL; failures are not cached.
+
     Args:
         url (str): Recipe URL to scrape
+        refresh (bool): Bypass the scrape cache and fetch the page again
 
     Returns:
         Tuple[List[str], str]: List of ingredients and recipe title
     """
+    cache_key = canonicalize_recipe_url(url)
+
+    if not refresh:
+        cached = _SCRAPE_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached scrape result for {url}")
+            ingredients, title = cached
+            return list(ingredients), title
+
+    ingredients, title = _scrape_ingredients_uncached(url)
+    _SCRAPE_CACHE.store(cache_key, (list(ingredients), title))
+
+    return ingredients, title
+
+def dedupe_ingredient_lines(ingredients: List[str]) -> List[str]:
+    """Drop repeated ingredient lines (ignoring case and whitespace), keeping the first spelling."""
+    unique_lines: Dict[str, str] = {}
+    for line in ingredients:
+        unique_lines.setdefault(_WHITESPACE_RE.sub(' ', line).strip().lower(), line)
+    return list(unique_lines.values())
+
+# Background page fetches that overlap with slower scraping methods
+_PAGE_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="recipe-prefetch")
+
+def _scrape_ingredients_uncached(url: str) -> Tuple[List[str], str]:
+    """Run the scraping methods in order of preference without consulting the cache."""
     logger.info(f"Starting smart scraping for {url}")
 
+    # The JSON-LD and pattern methods read the same page, so fetch it only once
+    shared_page: Dict[str, Future] = {}
+
+    def get_shared_html() -> bytes:
+        if 'future' not in shared_page:
+            future = Future()
+            try:
+                future.set_result(fetch_recipe_html(url))
+            except Exception as e:
+                future.set_exception(e)
+            shared_page['future'] = future
+        return shared_page['future'].result()
+
+    is_ah_url = 'ah.nl' in url.lower()
+
     # Try different scraping methods in order of preference
-    methods = []
-    
-    # Add AH-specific method if it's an AH URL
-    if 'ah.nl' in url.lower():
-        methods.append(("ah_specific", scrape_ah_specific))
-    
-    # Always try these methods
-    methods.extend([
-        ("requests_json_ld", scrape_with_requests_json_ld),
-        ("requests_patterns", scrape_with_requests_patterns),
-    ])
-    
-    # Add Selenium as last resort only if available
-    if SELENIUM_AVAILABLE:
-        methods.append(("selenium", scrape_with_selenium))
+    if is_ah_url:
+        methods = _AH_SCRAPE_METHOD_CHAIN
+        # The AH method takes seconds, so fetch the page for the generic methods meanwhile
+        shared_page['future'] = _PAGE_PREFETCH_EXECUTOR.submit(fetch_recipe_html, url)
+    else:
+        methods = _GENERIC_SCRAPE_METHOD_CHAIN
+
+    for method_name, method_func, reads_shared_page in methods:
+        # Selenium is the last resort, only if available
+        if method_name == "selenium" and not SELENIUM_AVAILABLE:
+            continue
 
-    for method_name, method_func in methods:
         try:
             logger.info(f"Trying method: {method_name}")
-            ingredients, title = method_func(url)
+            if reads_shared_page:
+                ingredients, title = method_func(url, get_shared_html())
+            else:
+                ingredients, title = method_func(url)
+            ingredients = dedupe_ingredient_lines(ingredients)
 
             if ingredients and len(ingredients) >= 3:
                 logger.info(f"Success with {method_name}: {len(ingredients)} ingredients found")
@@ -108,77 +368,117 @@ def smart_ingredient_scraping(url: str) -> Tuple[List[str], str]:
             logger.warning(f"Method {method_name} failed: {e}")
 
             # For AH URLs, provide more specific debugging
-            if 'ah.nl' in url.lower() and method_name == 'ah_specific':
+            if is_ah_url and method_name == 'ah_specific':
                 logger.info("AH advanced method failed, check debug/ folder for detailed logs")
 
             continue
 
     # Final fallback: suggest manual copy-paste for AH.nl
-    if 'ah.nl' in url.lower():
+    if is_ah_url:
         raise Exception("AH.nl blokkeert automatische toegang. Kopieer de ingrediënten handmatig van de receptpagina en plak ze in het tekstveld voor analyse.")
     
     raise Exception("Geen ingrediënten gevonden met alle beschikbare methoden")
 
-def scrape_with_requests_json_ld(url: str) -> Tuple[List[str], str]:
-    """Scrape using requests and JSON-LD structured data."""
-    # Enhanced headers to bypass AH.nl blocking
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-        'Accept-Language': 'nl-NL,nl;q=0.9,en;q=0.8',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-        'Cache-Control': 'max-age=0'
-    }
-
-    debug.log_request(url, "GET", headers)
+# Enhanced headers to bypass AH.nl blocking
+_DOCUMENT_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'nl-NL,nl;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0'
+}
+
+# Recipe pages above this size (e.g. inlined data-URI images) are not worth parsing
+_MAX_RECIPE_PAGE_BYTES = 5 * 1024 * 1024
+
+def fetch_recipe_html(url: str) -> bytes:
+    """Fetch a recipe page once so several parsers can share the response body."""
+    debug.log_request(url, "GET", _DOCUMENT_REQUEST_HEADERS)
     start_time = time.time()
 
-    # Try multiple request approaches for AH.nl
-    session = requests.Session()
-    session.headers.update(headers)
+    # Stream the body so oversized pages are rejected without buffering them whole
+    response = HTTP_SESSION.get(url, headers=_DOCUMENT_REQUEST_HEADERS, timeout=(5, 15), allow_redirects=True, stream=True)
+    try:
+        debug.log_response(response, time.time() - start_time)
+        response.raise_for_status()
+        return read_response_body(response)
+    finally:
+        response.close()
 
-    response = session.get(url, timeout=15, allow_redirects=True)
-    debug.log_response(response, time.time() - start_time)
+def read_response_body(response) -> bytes:
+    """Read a recipe page body in chunks, refusing pages above _MAX_RECIPE_PAGE_BYTES."""
+    content_length = response.headers.get('Content-Length')
+    if content_length and content_length.isdigit() and int(content_length) > _MAX_RECIPE_PAGE_BYTES:
+        raise Exception("Receptpagina is te groot om te verwerken")
 
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, 'html.parser')
+    chunks = []
+    received = 0
+    for chunk in response.iter_content(chunk_size=65536):
+        received += len(chunk)
+        if received > _MAX_RECIPE_PAGE_BYTES:
+            raise Exception("Receptpagina is te groot om te verwerken")
+        chunks.append(chunk)
 
-    # Save debug HTML
-    debug.save_debug_html(str(soup), url, "requests_json_ld")
+    return b"".join(chunks)
 
-    # Try JSON-LD structured data
-    json_scripts = soup.find_all('script', type='application/ld+json')
+_JSON_LD_SCRIPT_MATCHER = soupsieve.compile('script[type="application/ld+json"]')
+_JSON_LD_STRAINER = SoupStrainer('script', type='application/ld+json')
 
-    for script in json_scripts:
-        try:
-            data = json.loads(script.string)
-            if isinstance(data, list):
-                data = data[0]
+@lru_cache(maxsize=128)
+def _parse_json_ld_recipe(raw: str) -> Optional[Tuple[Tuple[str, ...], str]]:
+    """Decode one ld+json block into (ingredients, title), or None if it holds no usable recipe."""
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    if isinstance(data, list):
+        data = data[0]
 
-            if data.get('@type') == 'Recipe' or 'Recipe' in str(data.get('@type', [])):
-                ingredients = []
-                recipe_ingredients = data.get('recipeIngredient', [])
+    if not (data.get('@type') == 'Recipe' or 'Recipe' in str(data.get('@type', []))):
+        return None
 
-                for ingredient in recipe_ingredients:
-                    if isinstance(ingredient, dict):
-                        ingredient_text = ingredient.get('name', ingredient.get('text', ''))
-                    else:
-                        ingredient_text = str(ingredient)
+    ingredients = []
+    for ingredient in data.get('recipeIngredient', []):
+        if isinstance(ingredient, dict):
+            ingredient_text = ingredient.get('name', ingredient.get('text', ''))
+        else:
+            ingredient_text = str(ingredient)
 
-                    if ingredient_text:
-                        ingredients.append(ingredient_text.strip())
+        if ingredient_text:
+            ingredients.append(ingredient_text.strip())
 
-                title = data.get('name', 'Onbekend recept')
+    if not ingredients:
+        return None
 
-                if ingredients:
-                    return ingredients, title
+    return tuple(ingredients), data.get('name', 'Onbekend recept')
+
+def scrape_with_requests_json_ld(url: str, html: Optional[bytes] = None) -> Tuple[List[str], str]:
+    """Scrape using requests and JSON-LD structured data."""
+    if html is None:
+        html = fetch_recipe_html(url)
+    # Only the ld+json scripts are needed, so don't build the rest of the tree
+    soup = make_soup(html, parse_only=_JSON_LD_STRAINER)
+
+    # Save debug HTML, from the raw page since a strained soup only holds the scripts
+    debug.save_debug_html(html, url, "requests_json_ld")
+
+    # Try JSON-LD structured data, stopping the tree walk at the first recipe
+    for script in _JSON_LD_SCRIPT_MATCHER.iselect(soup):
+        # NavigableString subclasses str, which orjson rejects
+        raw = str(script.string or "")
+        # Skip Organization, BreadcrumbList etc. without decoding them
+        if 'Recipe' not in raw:
+            continue
+
+        try:
+            recipe = _parse_json_ld_recipe(raw)
+            if recipe:
+                ingredients, title = recipe
+                return list(ingredients), title
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.debug(f"JSON-LD parsing failed: {e}")
@@ -186,123 +486,184 @@ def scrape_with_requests_json_ld(url: str) -> Tuple[List[str], str]:
 
     raise Exception("Geen JSON-LD receptdata gevonden")
 
-def scrape_with_requests_patterns(url: str) -> Tuple[List[str], str]:
+# CSS selectors for the generic pattern-matching scraper, AH-specific selectors first, then common ones
+_PATTERN_INGREDIENT_SELECTORS = (
+    '.recipe-ingredient',
+    '.ingredient',
+    '.ingredients li',
+    '[data-ingredient]',
+    '.recipe-ingredients li',
+    '.ingredient-list li',
+    '.ingredients-list li',
+    # AH-specific selectors
+    '[data-testid="ingredient"]',
+    '.ingredient-item',
+    '.recipe-ingredients-list li',
+    'ul[data-testid="ingredients"] li',
+    '.ingredients-section li'
+)
+_PATTERN_TITLE_SELECTORS = ('h1', '.recipe-title', '.entry-title', 'title')
+
+# Collapses newlines and runs of whitespace inside scraped element text
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def compile_css_selectors(selectors) -> Tuple[Tuple[str, Any], ...]:
+    """Compile CSS selectors once with soupsieve, paired with their source text for logging."""
+    return tuple((selector, soupsieve.compile(selector)) for selector in selectors)
+
+def compile_selector_group(compiled_selectors) -> Any:
+    """Compile the union of several selectors so one tree walk can serve all of them."""
+    return soupsieve.compile(', '.join(selector for selector, _ in compiled_selectors))
+
+def select_per_selector(soup: BeautifulSoup, compiled_selectors, group_matcher) -> List[Tuple[str, List[Any]]]:
+    """
+    Walk the tree once with the union selector and bucket the matches per selector.
+
+    Each bucket holds what soup.select(selector) would return, in selector order,
+    so first-selector-wins logic keeps working without re-walking the tree.
+    """
+    buckets = [[] for _ in compiled_selectors]
+    for element in group_matcher.iselect(soup):
+        for bucket, (_, matcher) in zip(buckets, compiled_selectors):
+            if matcher.match(element):
+                bucket.append(element)
+    return [(selector, bucket) for (selector, _), bucket in zip(compiled_selectors, buckets)]
+
+_PATTERN_INGREDIENT_MATCHERS = compile_css_selectors(_PATTERN_INGREDIENT_SELECTORS)
+_PATTERN_INGREDIENT_GROUP = compile_selector_group(_PATTERN_INGREDIENT_MATCHERS)
+_PATTERN_TITLE_MATCHERS = compile_css_selectors(_PATTERN_TITLE_SELECTORS)
+
+def scrape_with_requests_patterns(url: str, html: Optional[bytes] = None) -> Tuple[List[str], str]:
     """Scrape using requests and pattern matching."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'nl-NL,nl;q=0.9,en;q=0.8',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1'
-    }
+    if html is None:
+        html = fetch_recipe_html(url)
 
-    session = requests.Session()
-    session.headers.update(headers)
-    response = session.get(url, timeout=15, allow_redirects=True)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, 'html.parser')
-
-    # AH-specific selectors first, then common ones
-    selectors = [
-        '.recipe-ingredient',
-        '.ingredient',
-        '.ingredients li',
-        '[data-ingredient]',
-        '.recipe-ingredients li',
-        '.ingredient-list li',
-        '.ingredients-list li',
-        # AH-specific selectors
-        '[data-testid="ingredient"]',
-        '.ingredient-item',
-        '.recipe-ingredients-list li',
-        'ul[data-testid="ingredients"] li',
-        '.ingredients-section li'
-    ]
+    if SELECTOLAX_AVAILABLE:
+        ingredients, title = _match_patterns_with_selectolax(html)
+    else:
+        ingredients, title = _match_patterns_with_soup(make_soup(html))
+
+    if not ingredients:
+        raise Exception("Geen ingrediënten gevonden met patroonherkenning")
+
+    return ingredients, title
+
+def _match_patterns_with_selectolax(html: bytes) -> Tuple[List[str], str]:
+    """Run the pattern selectors with the Lexbor-backed selectolax parser."""
+    tree = LexborHTMLParser(html)
 
     ingredients = []
+    # Nested markup often matches the same line under several selectors
+    seen = set()
+    for selector in _PATTERN_INGREDIENT_SELECTORS:
+        for node in tree.css(selector):
+            text = _WHITESPACE_RE.sub(' ', node.text()).strip()
+            if len(text) > 2 and text not in seen:
+                seen.add(text)
+                ingredients.append(text)
+
+        if len(ingredients) >= 3:
+            break
 
-    for selector in selectors:
-        elements = soup.select(selector)
-        if elements:
-            for element in elements:
-                text = element.get_text().strip()
-                if text and len(text) > 2:
-                    ingredients.append(text)
+    # Try to find title
+    title = "Onbekend recept"
+    for selector in _PATTERN_TITLE_SELECTORS:
+        title_node = tree.css_first(selector)
+        if title_node:
+            title = title_node.text().strip()
+            break
 
-            if len(ingredients) >= 3:
-                break
+    return ingredients, title
+
+def _match_patterns_with_soup(soup: BeautifulSoup) -> Tuple[List[str], str]:
+    """Run the pattern selectors with BeautifulSoup when selectolax is unavailable."""
+    ingredients = []
+    # Nested markup often matches the same line under several selectors
+    seen = set()
+    for _, elements in select_per_selector(soup, _PATTERN_INGREDIENT_MATCHERS, _PATTERN_INGREDIENT_GROUP):
+        for element in elements:
+            text = _WHITESPACE_RE.sub(' ', element.get_text()).strip()
+            if len(text) > 2 and text not in seen:
+                seen.add(text)
+                ingredients.append(text)
+
+        if len(ingredients) >= 3:
+            break
 
     # Try to find title
     title = "Onbekend recept"
-    title_selectors = ['h1', '.recipe-title', '.entry-title', 'title']
-    for selector in title_selectors:
-        title_elem = soup.select_one(selector)
+    for _, matcher in _PATTERN_TITLE_MATCHERS:
+        title_elem = matcher.select_one(soup)
         if title_elem:
             title = title_elem.get_text().strip()
             break
 
-    if not ingredients:
-        raise Exception("Geen ingrediënten gevonden met patroonherkenning")
-
     return ingredients, title
 
-def get_advanced_user_agents():
-    """Get realistic user agents with current browser versions."""
-    return [
-        # Chrome Windows
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-        
-        # Chrome macOS
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-        
-        # Firefox
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0',
-        'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
-        
-        # Safari
-        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
-        'Mozilla/5.0 (iPad; CPU OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
-        
-        # Edge
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
-        
-        # Mobile Chrome
-        'Mozilla/5.0 (Linux; Android 14; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
-        'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1'
-    ]
+# Realistic user agents with current browser versions
+_USER_AGENTS = (
+    # Chrome Windows
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
 
-def get_free_proxy_list():
-    """Get list of free proxies - basic implementation."""
-    # Deze proxies zijn vaak tijdelijk en kunnen uitvallen
-    return [
-        # Nederlandse proxies (vaak beter voor AH.nl)
-        {'http': 'http://185.93.3.123:8080', 'https': 'http://185.93.3.123:8080'},
-        {'http': 'http://31.220.109.82:80', 'https': 'http://31.220.109.82:80'},
-        
-        # Duitse proxies (dichtbij Nederland)
-        {'http': 'http://217.182.170.87:80', 'https': 'http://217.182.170.87:80'},
-        {'http': 'http://46.101.13.77:80', 'https': 'http://46.101.13.77:80'},
-        
-        # Belgische proxies
-        {'http': 'http://195.244.25.51:80', 'https': 'http://195.244.25.51:80'},
-    ]
+    # Chrome macOS
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+
+    # Firefox
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
+
+    # Safari
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (iPad; CPU OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
+
+    # Edge
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+
+    # Mobile Chrome
+    'Mozilla/5.0 (Linux; Android 14; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1'
+)
+
+# Deze proxies zijn vaak tijdelijk en kunnen uitvallen
+_FREE_PROXIES = (
+    # Nederlandse proxies (vaak beter voor AH.nl)
+    {'http': 'http://185.93.3.123:8080', 'https': 'http://185.93.3.123:8080'},
+    {'http': 'http://31.220.109.82:80', 'https': 'http://31.220.109.82:80'},
+
+    # Duitse proxies (dichtbij Nederland)
+    {'http': 'http://217.182.170.87:80', 'https': 'http://217.182.170.87:80'},
+    {'http': 'http://46.101.13.77:80', 'https': 'http://46.101.13.77:80'},
+
+    # Belgische proxies
+    {'http': 'http://195.244.25.51:80', 'https': 'http://195.244.25.51:80'},
+)
+
+# Proxy rotation order: direct connection first, then the free proxies
+_PROXY_ROTATION = (None,) + _FREE_PROXIES
+
+# urllib3 2.x can cap and jitter the retry backoff per Retry instance
+if int(urllib3.__version__.split('.')[0]) >= 2:
+    _RETRY_BACKOFF_OPTIONS = {'backoff_max': 10, 'backoff_jitter': 0.5}
+else:
+    _RETRY_BACKOFF_OPTIONS = {}
 
 def create_session_with_retries():
     """Create session with retry strategy."""
     session = requests.Session()
     
-    # Retry strategy
+    # Retry strategy; exhausted status retries hand back the last response instead of raising
     retry_strategy = Retry(
         total=3,
         status_forcelist=[429, 500, 502, 503, 504],
-        method_whitelist=["HEAD", "GET", "OPTIONS"],
-        backoff_factor=1
+        allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
+        backoff_factor=1,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        **_RETRY_BACKOFF_OPTIONS
     )
     
     adapter = HTTPAdapter(max_retries=retry_strategy)
@@ -311,24 +672,28 @@ def create_session_with_retries():
     
     return session
 
-def generate_realistic_headers(user_agent: str):
-    """Generate realistic headers based on user agent."""
+# Header values drawn per request; header templates hold None for these keys
+_RANDOM_HEADER_CHOICES = (
+    ('Accept-Language', ('nl-NL,nl;q=0.9,en;q=0.8', 'en-US,en;q=0.9,nl;q=0.8', 'nl,en-US;q=0.9,en;q=0.8')),
+    ('Cache-Control', ('max-age=0', 'no-cache')),
+    ('Sec-Fetch-Site', ('none', 'same-origin', 'cross-site')),
+    ('Sec-Ch-Ua-Platform', ('"Windows"', '"macOS"', '"Linux"')),
+)
+
+def _build_header_template(user_agent: str) -> Dict[str, Optional[str]]:
+    """Build the fixed part of the realistic headers for a user agent."""
     is_mobile = 'Mobile' in user_agent or 'iPhone' in user_agent
     is_firefox = 'Firefox' in user_agent
     is_safari = 'Safari' in user_agent and 'Chrome' not in user_agent
     
     headers = {
         'User-Agent': user_agent,
-        'Accept-Language': random.choice([
-            'nl-NL,nl;q=0.9,en;q=0.8',
-            'en-US,en;q=0.9,nl;q=0.8',
-            'nl,en-US;q=0.9,en;q=0.8'
-        ]),
+        'Accept-Language': None,
         'Accept-Encoding': 'gzip, deflate, br',
         'DNT': '1',
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1',
-        'Cache-Control': random.choice(['max-age=0', 'no-cache']),
+        'Cache-Control': None,
     }
     
     if is_firefox:
@@ -348,68 +713,106 @@ def generate_realistic_headers(user_agent: str):
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': random.choice(['none', 'same-origin', 'cross-site']),
+            'Sec-Fetch-Site': None,
             'Sec-Fetch-User': '?1',
             'Sec-Ch-Ua': f'"Chromium";v="120", "Not(A:Brand";v="24", "Google Chrome";v="120"',
             'Sec-Ch-Ua-Mobile': '?1' if is_mobile else '?0',
-            'Sec-Ch-Ua-Platform': random.choice(['"Windows"', '"macOS"', '"Linux"']),
+            'Sec-Ch-Ua-Platform': None,
         })
     
+    return headers
+
+_HEADER_TEMPLATES = {user_agent: _build_header_template(user_agent) for user_agent in _USER_AGENTS}
+
+def generate_realistic_headers(user_agent: str):
+    """Generate realistic headers based on user agent."""
+    template = _HEADER_TEMPLATES.get(user_agent)
+    headers = template.copy() if template is not None else _build_header_template(user_agent)
+
+    # Only the randomized values are filled in per request
+    for key, choices in _RANDOM_HEADER_CHOICES:
+        if key in headers and headers[key] is None:
+            headers[key] = random.choice(choices)
+    
     # Add random extra headers sometimes
     if random.choice([True, False]):
         headers['X-Requested-With'] = 'XMLHttpRequest'
     
     return headers
 
+# Human-like pauses before AH requests only apply for a while after AH blocked us
+_AH_BLOCK_COOLDOWN_SECONDS = 300
+_last_ah_block_ts = 0.0
+
+def _record_ah_block() -> None:
+    """Remember that AH just answered with a block (403/429)."""
+    global _last_ah_block_ts
+    _last_ah_block_ts = time.time()
+
+def _ah_backoff_delay(low: float, high: float) -> None:
+    """Sleep a random delay between low and high seconds, but only after a recent AH block."""
+    if time.time() - _last_ah_block_ts < _AH_BLOCK_COOLDOWN_SECONDS:
+        time.sleep(random.uniform(low, high))
+
+# Retry sessions per proxy (None = direct), kept across scrapes so connections and AH cookies are reused
+_proxy_sessions: Dict[Optional[str], requests.Session] = {}
+_proxy_sessions_lock = threading.Lock()
+
+def get_proxy_session(proxies: Optional[Dict[str, str]]) -> requests.Session:
+    """Return the retry session for a proxy, creating it on first use."""
+    key = proxies['http'] if proxies else None
+    with _proxy_sessions_lock:
+        session = _proxy_sessions.get(key)
+        if session is None:
+            session = _proxy_sessions[key] = create_session_with_retries()
+    return session
+
 def scrape_ah_with_proxy_rotation(url: str) -> Tuple[List[str], str]:
     """Advanced AH scraping with proxy rotation."""
     logger.info("Trying advanced proxy rotation method for AH.nl")
     
-    user_agents = get_advanced_user_agents()
-    proxies_list = get_free_proxy_list()
-    
-    # Add no-proxy as first option
-    proxies_list.insert(0, None)
-    
-    for attempt in range(len(proxies_list)):
+    for attempt, proxies in enumerate(_PROXY_ROTATION):
         try:
-            user_agent = random.choice(user_agents)
+            user_agent = random.choice(_USER_AGENTS)
             headers = generate_realistic_headers(user_agent)
-            proxies = proxies_list[attempt] if attempt < len(proxies_list) else None
             
-            session = create_session_with_retries()
-            session.headers.update(headers)
+            # Headers go per request since the session is shared between scrapes
+            session = get_proxy_session(proxies)
             
-            # Random delay to appear human
-            time.sleep(random.uniform(2, 6))
+            # Random delay to appear human, once AH has started blocking
+            _ah_backoff_delay(2, 6)
             
             logger.info(f"Attempt {attempt + 1}: Using {'proxy' if proxies else 'direct connection'}")
             
-            # Try to access homepage first (cookie collection)
-            try:
-                session.get("https://www.ah.nl", 
-                           proxies=proxies, 
-                           timeout=15, 
-                           allow_redirects=True)
-                time.sleep(random.uniform(1, 3))
-            except:
-                pass
-            
-            # Now try the recipe page
-            response = session.get(url, 
-                                 proxies=proxies, 
-                                 timeout=25, 
-                                 allow_redirects=True)
+            # Try to access homepage first (cookie collection), unless this session already has AH cookies
+            if not any(cookie.domain.endswith('ah.nl') for cookie in session.cookies):
+                try:
+                    session.get("https://www.ah.nl", 
+                               headers=headers,
+                               proxies=proxies, 
+                               timeout=15, 
+                               allow_redirects=True)
+                    _ah_backoff_delay(1, 3)
+                except:
+                    pass
             
-            if response.status_code == 200:
-                logger.info(f"Success with attempt {attempt + 1}")
-                return parse_ah_response(response, url)
-            elif response.status_code == 403:
-                logger.warning(f"Attempt {attempt + 1} blocked (403)")
-                continue
-            else:
-                logger.warning(f"Attempt {attempt + 1} failed with status {response.status_code}")
-                continue
+            # Now try the recipe page, streamed so blocked attempts don't download the body
+            with session.get(url, 
+                             headers=headers,
+                             proxies=proxies, 
+                             timeout=25, 
+                             allow_redirects=True,
+                             stream=True) as response:
+                if response.status_code == 200:
+                    logger.info(f"Success with attempt {attempt + 1}")
+                    return parse_ah_response(response, url)
+                elif response.status_code in (403, 429):
+                    logger.warning(f"Attempt {attempt + 1} blocked ({response.status_code})")
+                    _record_ah_block()
+                    continue
+                else:
+                    logger.warning(f"Attempt {attempt + 1} failed with status {response.status_code}")
+                    continue
                 
         except Exception as e:
             logger.warning(f"Attempt {attempt + 1} failed: {e}")
@@ -417,12 +820,52 @@ def scrape_ah_with_proxy_rotation(url: str) -> Tuple[List[str], str]:
     
     raise Exception("Alle proxy pogingen gefaald voor AH.nl")
 
+# AH recipe IDs as they appear in allerhande URLs, e.g. /recept/R-R1201256/
+_AH_RECIPE_ID_RE = re.compile(r'/recept/(R-R\d+)/')
+
+# HTTP/2 client for the AH API probes, so they share one multiplexed connection per host
+_ah_api_client = None
+_ah_api_client_lock = threading.Lock()
+
+def get_ah_api_client():
+    """Return the shared HTTP/2 client for AH API requests, creating it on first use."""
+    global _ah_api_client
+
+    if _ah_api_client is None:
+        with _ah_api_client_lock:
+            if _ah_api_client is None:
+                _ah_api_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                    timeout=15.0
+                )
+    return _ah_api_client
+
+# The AH API endpoints are probed concurrently; at most one of them answers
+_AH_API_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ah-api-probe")
+
+def _probe_ah_api_endpoint(http_get, endpoint: str, headers: Dict[str, str]) -> Optional[Tuple[List[str], str]]:
+    """Fetch one AH API endpoint and return (ingredients, title) if it yields ingredients."""
+    try:
+        logger.info(f"Trying API endpoint: {endpoint}")
+        response = http_get(endpoint, headers=headers, timeout=15)
+        
+        if response.status_code == 200:
+            data = decode_json_response(response)
+            ingredients = extract_ingredients_from_api_data(data)
+            if ingredients:
+                return ingredients, data.get('name', 'AH Recept')
+    except Exception as e:
+        logger.debug(f"API endpoint {endpoint} failed: {e}")
+    
+    return None
+
 def scrape_ah_via_api_endpoints(url: str) -> Tuple[List[str], str]:
     """Try to find AH API endpoints for recipe data."""
     logger.info("Trying AH API endpoint method")
     
     # Extract recipe ID from URL
-    recipe_id_match = re.search(r'/recept/(R-R\d+)/', url)
+    recipe_id_match = _AH_RECIPE_ID_RE.search(url)
     if not recipe_id_match:
         raise Exception("Could not extract recipe ID from URL")
     
@@ -436,7 +879,7 @@ def scrape_ah_via_api_endpoints(url: str) -> Tuple[List[str], str]:
         f"https://ah.nl/allerhande/api/recipe/{recipe_id}",
     ]
     
-    user_agent = random.choice(get_advanced_user_agents())
+    user_agent = random.choice(_USER_AGENTS)
     headers = {
         'User-Agent': user_agent,
         'Accept': 'application/json, text/plain, */*',
@@ -446,27 +889,22 @@ def scrape_ah_via_api_endpoints(url: str) -> Tuple[List[str], str]:
         'X-Requested-With': 'XMLHttpRequest',
     }
     
-    session = create_session_with_retries()
-    
-    for endpoint in api_endpoints:
-        try:
-            logger.info(f"Trying API endpoint: {endpoint}")
-            response = session.get(endpoint, headers=headers, timeout=15)
-            
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    ingredients = extract_ingredients_from_api_data(data)
-                    if ingredients:
-                        title = data.get('name', 'AH Recept')
-                        logger.info(f"API success: {len(ingredients)} ingredients")
-                        return ingredients, title
-                except:
-                    continue
-            
-        except Exception as e:
-            logger.debug(f"API endpoint {endpoint} failed: {e}")
-            continue
+    http_get = get_ah_api_client().get if HTTP2_AVAILABLE else HTTP_SESSION.get
+
+    futures = [
+        _AH_API_PROBE_EXECUTOR.submit(_probe_ah_api_endpoint, http_get, endpoint, headers)
+        for endpoint in api_endpoints
+    ]
+    try:
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                logger.info(f"API success: {len(result[0])} ingredients")
+                return result
+    finally:
+        # Drop probes that have not started yet once one endpoint answered
+        for future in futures:
+            future.cancel()
     
     raise Exception("Geen werkende AH API endpoints gevonden")
 
@@ -509,13 +947,78 @@ def extract_ingredients_from_api_data(data: Dict) -> List[str]:
     
     return ingredients
 
-def scrape_ah_with_browser_automation_evasion(url: str) -> Tuple[List[str], str]:
-    """Advanced browser automation with anti-detection."""
-    if not SELENIUM_AVAILABLE:
-        raise Exception("Selenium niet beschikbaar voor geavanceerde methode")
-    
-    logger.info("Using advanced browser automation with anti-detection")
-    
+# Ingredient selectors for the AH evasion method, tried in order after one combined wait
+_EVASION_INGREDIENT_SELECTORS = (
+    '.recipe-ingredients li',
+    '[data-testid="ingredient"]',
+    '.ingredient-item',
+    '.ingredient',
+    'ul[class*="ingredient"] li',
+    '.recipe-ingredient-list li'
+)
+_EVASION_INGREDIENT_SELECTOR_GROUP = ', '.join(_EVASION_INGREDIENT_SELECTORS)
+
+# Chrome content settings for scraping: no images and no notification prompts (2 = block)
+_SELENIUM_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+class _DriverPool:
+    """Idle headless Chrome drivers kept alive between scrapes, capped at max_size."""
+
+    def __init__(self, name: str, factory: Callable[[], Any], max_size: int):
+        self.name = name
+        self.factory = factory
+        self.max_size = max_size
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()
+
+    def acquire(self):
+        """Take an idle driver from the pool, or start a new one."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        driver = self.factory()
+        # Only explicit waits; an implicit wait would stack on top of every WebDriverWait poll
+        driver.implicitly_wait(0)
+        debug.log_selenium_action(f"{self.name} driver created", "Headless Chrome")
+        return driver
+
+    def release(self, driver) -> None:
+        """Reset a driver and return it to the pool, or quit it if it is unusable or not needed."""
+        try:
+            # Start the next recipe without this visit's cookies
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            if self._idle.qsize() < self.max_size:
+                self._idle.put_nowait(driver)
+                debug.log_selenium_action(f"{self.name} driver returned to pool", "Reused for next request")
+                return
+        except Exception as e:
+            logger.debug(f"{self.name} driver reset failed, discarding it: {e}")
+
+        try:
+            driver.quit()
+            debug.log_selenium_action(f"{self.name} driver closed", "Cleanup completed")
+        except Exception:
+            pass
+
+    def shutdown(self) -> None:
+        """Quit all idle drivers."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+def _create_evasion_driver():
+    """Start the headless Chrome driver with anti-detection options."""
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -523,53 +1026,60 @@ def scrape_ah_with_browser_automation_evasion(url: str) -> Tuple[List[str], str]
     options.add_argument('--disable-gpu')
     options.add_argument('--disable-extensions')
     options.add_argument('--disable-plugins')
-    options.add_argument('--disable-images')
     options.add_argument('--disable-javascript')  # Sometimes helps with detection
     
     # Anti-detection measures
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+
+    # Block images and notification prompts through Chrome's content settings
+    options.add_experimental_option("prefs", _SELENIUM_CONTENT_PREFS)
+
+    # Return as soon as the DOM is ready instead of waiting for images and fonts
+    options.page_load_strategy = 'eager'
+
+    return webdriver.Chrome(options=options)
+
+# Stealth drivers for the AH evasion method
+_EVASION_DRIVER_POOL = _DriverPool("Evasion", _create_evasion_driver, 2)
+
+def scrape_ah_with_browser_automation_evasion(url: str) -> Tuple[List[str], str]:
+    """Advanced browser automation with anti-detection."""
+    if not SELENIUM_AVAILABLE:
+        raise Exception("Selenium niet beschikbaar voor geavanceerde methode")
     
-    # Random window size
-    width = random.randint(1200, 1920)
-    height = random.randint(800, 1080)
-    options.add_argument(f'--window-size={width},{height}')
-    
-    # Random user agent
-    user_agent = random.choice(get_advanced_user_agents())
-    options.add_argument(f'--user-agent={user_agent}')
-    
-    driver = None
+    logger.info("Using advanced browser automation with anti-detection")
+
+    driver = _EVASION_DRIVER_POOL.acquire()
     try:
-        driver = webdriver.Chrome(options=options)
-        
+        # Random window size and user agent per recipe, applied to the running browser
+        driver.set_window_size(random.randint(1200, 1920), random.randint(800, 1080))
+        user_agent = random.choice(_USER_AGENTS)
+        driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': user_agent})
+
         # Execute script to hide automation markers
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
-        # Random delays and human-like behavior
-        time.sleep(random.uniform(2, 5))
+        # Random delays and human-like behavior, once AH has started blocking
+        _ah_backoff_delay(2, 5)
         
         # Visit AH homepage first
         driver.get("https://www.ah.nl")
-        time.sleep(random.uniform(3, 7))
+        _ah_backoff_delay(3, 7)
         
-        # Now visit recipe page
+        # Now visit recipe page and continue as soon as the ingredients are rendered
         driver.get(url)
-        time.sleep(random.uniform(5, 10))
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _EVASION_INGREDIENT_SELECTOR_GROUP))
+            )
+        except TimeoutException:
+            logger.debug(f"No AH ingredient elements rendered within 10s for {url}")
         
         # Try multiple selectors
-        selectors = [
-            '.recipe-ingredients li',
-            '[data-testid="ingredient"]',
-            '.ingredient-item',
-            '.ingredient',
-            'ul[class*="ingredient"] li',
-            '.recipe-ingredient-list li'
-        ]
-        
         ingredients = []
-        for selector in selectors:
+        for selector in _EVASION_INGREDIENT_SELECTORS:
             try:
                 elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements:
@@ -598,71 +1108,87 @@ def scrape_ah_with_browser_automation_evasion(url: str) -> Tuple[List[str], str]
             raise Exception("Geen ingrediënten gevonden met geavanceerde browser methode")
         
         return ingredients, title
-        
-    finally:
-        if driver:
+
+    except WebDriverException:
+        # The browser itself failed; don't hand a broken driver to the next recipe
+        try:
             driver.quit()
+        except Exception:
+            pass
+        driver = None
+        raise
+
+    finally:
+        if driver is not None:
+            _EVASION_DRIVER_POOL.release(driver)
+
+# Matches "ingredient", "recipeIngredient" and "ingrediënten" in raw page bytes
+_INGREDIENT_MARKER_RE = re.compile(rb'ingredi', re.IGNORECASE)
+
+# Selectors for proxied AH responses, compiled once at import
+_AH_RESPONSE_TITLE_MATCHERS = compile_css_selectors((
+    'h1[data-testid="recipe-title"]',
+    'h1.recipe-title',
+    '.recipe-header h1',
+    'h1'
+))
+_AH_RESPONSE_INGREDIENT_MATCHERS = compile_css_selectors((
+    '[data-testid="ingredient"]',
+    '[data-testid="ingredients"] li',
+    '.recipe-ingredients li',
+    '.ingredients-list li',
+    '.ingredient-item',
+    'ul[class*="ingredient"] li',
+    '[class*="ingredient-list"] li',
+    '.recipe-ingredient-list li',
+    'li[class*="ingredient"]',
+    '[data-ingredient]',
+    '.recipe-content ul li',
+    '.ingredients ul li',
+    # More specific AH selectors
+    '.ah-ingredient',
+    '.allerhande-ingredient',
+    '[data-qa="ingredient"]',
+    '.recipe-ingredients .ingredient'
+))
+_AH_RESPONSE_INGREDIENT_GROUP = compile_selector_group(_AH_RESPONSE_INGREDIENT_MATCHERS)
 
 def parse_ah_response(response, url: str) -> Tuple[List[str], str]:
     """Parse successful AH response."""
-    soup = BeautifulSoup(response.content, 'html.parser')
+    html = read_response_body(response)
     
     # Save debug HTML
-    debug.save_debug_html(str(soup), url, "proxy_success")
+    debug.save_debug_html(html, url, "proxy_success")
+
+    # Block pages and login walls served with 200 have no ingredient markup; skip parsing them
+    if not _INGREDIENT_MARKER_RE.search(html):
+        raise Exception("Geen ingrediënten gevonden in response")
+
+    soup = make_soup(html)
     
     ingredients = []
     title = "AH Recept"
     
     # Get title
-    title_selectors = [
-        'h1[data-testid="recipe-title"]',
-        'h1.recipe-title',
-        '.recipe-header h1',
-        'h1'
-    ]
-    
-    for selector in title_selectors:
-        title_elem = soup.select_one(selector)
+    for _, matcher in _AH_RESPONSE_TITLE_MATCHERS:
+        title_elem = matcher.select_one(soup)
         if title_elem:
             title = title_elem.get_text().strip()
             break
     
     # Get ingredients with extended selectors
-    ah_selectors = [
-        '[data-testid="ingredient"]',
-        '[data-testid="ingredients"] li',
-        '.recipe-ingredients li',
-        '.ingredients-list li',
-        '.ingredient-item',
-        'ul[class*="ingredient"] li',
-        '[class*="ingredient-list"] li',
-        '.recipe-ingredient-list li',
-        'li[class*="ingredient"]',
-        '[data-ingredient]',
-        '.recipe-content ul li',
-        '.ingredients ul li',
-        # More specific AH selectors
-        '.ah-ingredient',
-        '.allerhande-ingredient',
-        '[data-qa="ingredient"]',
-        '.recipe-ingredients .ingredient'
-    ]
-    
-    for selector in ah_selectors:
+    for _, elements in select_per_selector(soup, _AH_RESPONSE_INGREDIENT_MATCHERS, _AH_RESPONSE_INGREDIENT_GROUP):
         try:
-            elements = soup.select(selector)
-            if elements:
-                temp_ingredients = []
-                for element in elements:
-                    text = element.get_text().strip()
-                    if text and len(text) > 2:
-                        text = text.replace('\n', ' ').replace('\t', ' ')
-                        text = ' '.join(text.split())
-                        temp_ingredients.append(text)
-                
-                if len(temp_ingredients) >= 3:
-                    ingredients = temp_ingredients
-                    break
+            temp_ingredients = []
+            for element in elements:
+                text = element.get_text().strip()
+                if text and len(text) > 2:
+                    text = _WHITESPACE_RE.sub(' ', text)
+                    temp_ingredients.append(text)
+
+            if len(temp_ingredients) >= 3:
+                ingredients = temp_ingredients
+                break
         except:
             continue
     
@@ -676,17 +1202,10 @@ def scrape_ah_specific(url: str) -> Tuple[List[str], str]:
     logger.info("Starting advanced AH scraping with all techniques")
     
     # Try methods in order of preference
-    methods = [
-        ("Proxy Rotation", lambda: scrape_ah_with_proxy_rotation(url)),
-        ("API Endpoints", lambda: scrape_ah_via_api_endpoints(url)),
-        ("Browser Evasion", lambda: scrape_ah_with_browser_automation_evasion(url)),
-        ("Original Method", lambda: scrape_ah_original_method(url))
-    ]
-    
-    for method_name, method_func in methods:
+    for method_name, method_func in _AH_SPECIFIC_METHOD_CHAIN:
         try:
             logger.info(f"Trying {method_name}")
-            ingredients, title = method_func()
+            ingredients, title = method_func(url)
             if ingredients and len(ingredients) >= 3:
                 logger.info(f"Success with {method_name}: {len(ingredients)} ingredients")
                 return ingredients, title
@@ -696,38 +1215,70 @@ def scrape_ah_specific(url: str) -> Tuple[List[str], str]:
     
     raise Exception("Alle geavanceerde AH scraping methoden gefaald")
 
+# Title and ingredient selectors for direct AH page scraping, compiled once at import
+_AH_PAGE_TITLE_MATCHERS = compile_css_selectors((
+    'h1[data-testid="recipe-title"]',
+    'h1.recipe-title',
+    '.recipe-header h1',
+    'h1',
+    '[data-testid="recipe-name"]'
+))
+_AH_PAGE_INGREDIENT_MATCHERS = compile_css_selectors((
+    '[data-testid="ingredient"]',
+    '[data-testid="ingredients"] li',
+    '.recipe-ingredients li',
+    '.ingredients-list li',
+    '.ingredient-item',
+    'ul[class*="ingredient"] li',
+    '[class*="ingredient-list"] li',
+    '.recipe-ingredient-list li',
+    # Fallback selectors
+    'li[class*="ingredient"]',
+    '[data-ingredient]',
+    '.recipe-content ul li',
+    '.ingredients ul li'
+))
+_AH_PAGE_INGREDIENT_GROUP = compile_selector_group(_AH_PAGE_INGREDIENT_MATCHERS)
+
+# The AH page-text fallback keeps at most this many measurement lines
+_AH_TEXT_FALLBACK_MAX_LINES = 15
+
+# Whole lines with an amount and unit in the AH page text, which are likely ingredients
+_AH_MEASUREMENT_LINE_RE = re.compile(r'^[^\n]*?\d+[^\S\n]*(?:gram|g|kg|ml|l|el|tl|stuks?|blik|pak)[^\n]*', re.IGNORECASE | re.MULTILINE)
+
+# Browser headers for the original AH method; only the User-Agent varies per call
+_AH_ORIGINAL_METHOD_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'nl-NL,nl;q=0.9,en;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'cross-site',
+    'Sec-Fetch-User': '?1',
+    'Sec-Ch-Ua': '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
+    'Sec-Ch-Ua-Mobile': '?0',
+    'Sec-Ch-Ua-Platform': '"Windows"'
+}
+
 def scrape_ah_original_method(url: str) -> Tuple[List[str], str]:
     """Original AH scraping method as fallback."""
-    user_agents = get_advanced_user_agents()
     
-    headers = {
-        'User-Agent': random.choice(user_agents),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-        'Accept-Language': 'nl-NL,nl;q=0.9,en;q=0.8',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'cross-site',
-        'Sec-Fetch-User': '?1',
-        'Sec-Ch-Ua': '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
-        'Sec-Ch-Ua-Mobile': '?0',
-        'Sec-Ch-Ua-Platform': '"Windows"'
-    }
+    headers = {'User-Agent': random.choice(_USER_AGENTS), **_AH_ORIGINAL_METHOD_HEADERS}
 
-    session = requests.Session()
-    session.headers.update(headers)
+    # Reuse the pooled session; headers go per request so it stays shareable across hosts
+    session = HTTP_SESSION
 
-    # Add random delay to appear more human-like
-    time.sleep(random.uniform(2, 5))
+    # Add random delay to appear more human-like, once AH has started blocking
+    _ah_backoff_delay(2, 5)
 
     try:
         # Try with different approaches
         attempts = [
             # Attempt 1: Direct request
-            lambda: session.get(url, timeout=25, allow_redirects=True),
+            lambda: session.get(url, headers=headers, timeout=25, allow_redirects=True),
             # Attempt 2: With referer
             lambda: session.get(url, timeout=25, allow_redirects=True, headers={**headers, 'Referer': 'https://www.ah.nl/allerhande'}),
             # Attempt 3: Simulated navigation
@@ -736,6 +1287,7 @@ def scrape_ah_original_method(url: str) -> Tuple[List[str], str]:
         
         response = None
         last_error = None
+        last_attempt = len(attempts) - 1
         
         for i, attempt in enumerate(attempts):
             try:
@@ -745,14 +1297,17 @@ def scrape_ah_original_method(url: str) -> Tuple[List[str], str]:
                     break
                 elif response.status_code == 403:
                     logger.warning(f"Attempt {i+1} blocked with 403, trying next method")
-                    time.sleep(random.uniform(3, 7))  # Longer delay after being blocked
+                    _record_ah_block()
+                    if i < last_attempt:
+                        _ah_backoff_delay(3, 7)  # Longer delay after being blocked
                     continue
                 else:
                     logger.warning(f"Attempt {i+1} failed with status {response.status_code}")
             except Exception as e:
                 last_error = e
                 logger.warning(f"Attempt {i+1} failed: {e}")
-                time.sleep(random.uniform(2, 4))
+                if i < last_attempt:
+                    _ah_backoff_delay(2, 4)
                 continue
         
         if not response or response.status_code != 200:
@@ -763,59 +1318,32 @@ def scrape_ah_original_method(url: str) -> Tuple[List[str], str]:
             else:
                 raise Exception("Alle AH scraping pogingen gefaald")
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        html = read_response_body(response)
 
         # Save debug HTML for AH
-        debug.save_debug_html(str(soup), url, "ah_specific")
+        debug.save_debug_html(html, url, "ah_specific")
 
         ingredients = []
-        title = "AH Recept"
 
-        # Try to get title first
-        title_selectors = [
-            'h1[data-testid="recipe-title"]',
-            'h1.recipe-title',
-            '.recipe-header h1',
-            'h1',
-            '[data-testid="recipe-name"]'
-        ]
-
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                title = title_elem.get_text().strip()
-                break
-
-        # AH-specific ingredient selectors with multiple strategies
-        ah_selectors = [
-            '[data-testid="ingredient"]',
-            '[data-testid="ingredients"] li',
-            '.recipe-ingredients li',
-            '.ingredients-list li',
-            '.ingredient-item',
-            'ul[class*="ingredient"] li',
-            '[class*="ingredient-list"] li',
-            '.recipe-ingredient-list li',
-            # Fallback selectors
-            'li[class*="ingredient"]',
-            '[data-ingredient]',
-            '.recipe-content ul li',
-            '.ingredients ul li'
-        ]
+        # AH-specific ingredient selectors with multiple strategies, skipped on pages
+        # without any ingredient markup (the text fallback below still runs)
+        scan_ingredients = bool(_INGREDIENT_MARKER_RE.search(html))
+        if SELECTOLAX_AVAILABLE:
+            title, ingredient_matches, read_page_text = _select_ah_page_with_selectolax(html, scan_ingredients)
+        else:
+            title, ingredient_matches, read_page_text = _select_ah_page_with_soup(html, scan_ingredients)
 
-        for selector in ah_selectors:
+        for selector, texts in ingredient_matches:
             try:
-                elements = soup.select(selector)
-                logger.debug(f"AH selector '{selector}' found {len(elements)} elements")
+                logger.debug(f"AH selector '{selector}' found {len(texts)} elements")
 
-                if elements:
+                if texts:
                     temp_ingredients = []
-                    for element in elements:
-                        text = element.get_text().strip()
+                    for text in texts:
+                        text = text.strip()
                         if text and len(text) > 2:
-                            # Clean up common AH formatting
-                            text = text.replace('\n', ' ').replace('\t', ' ')
-                            text = ' '.join(text.split())  # Remove extra whitespace
+                            # Clean up common AH formatting: newlines, tabs and extra whitespace
+                            text = _WHITESPACE_RE.sub(' ', text)
                             temp_ingredients.append(text)
 
                     if len(temp_ingredients) >= 3:
@@ -830,23 +1358,22 @@ def scrape_ah_original_method(url: str) -> Tuple[List[str], str]:
         # If still no ingredients found, try text-based extraction from page content
         if not ingredients:
             logger.info("Trying text-based extraction for AH recipe")
-            page_text = soup.get_text()
+            page_text = read_page_text()
 
-            # Look for ingredient patterns in the full text
-            lines = page_text.split('\n')
+            # Look for lines that contain measurements (likely ingredients) in one pass
+            # over the full text, instead of splitting the page into lines first
             potential_ingredients = []
 
-            for line in lines:
-                line = line.strip()
-                if not line or len(line) < 3:
-                    continue
-
-                # Look for lines that contain measurements (likely ingredients)
-                if re.search(r'\d+\s*(gram|g|kg|ml|l|el|tl|stuks?|blik|pak)', line, re.IGNORECASE):
+            for match in _AH_MEASUREMENT_LINE_RE.finditer(page_text):
+                line = match.group().strip()
+                if len(line) >= 3:
                     potential_ingredients.append(line)
+                    # Limit to reasonable amount, and stop scanning once it is reached
+                    if len(potential_ingredients) == _AH_TEXT_FALLBACK_MAX_LINES:
+                        break
 
             if len(potential_ingredients) >= 3:
-                ingredients = potential_ingredients[:15]  # Limit to reasonable amount
+                ingredients = potential_ingredients
 
         if not ingredients:
             raise Exception("Geen ingrediënten gevonden met AH-specifieke methode")
@@ -856,13 +1383,60 @@ def scrape_ah_original_method(url: str) -> Tuple[List[str], str]:
     except requests.exceptions.RequestException as e:
         raise Exception(f"AH scraping request failed: {e}")
 
+def _select_ah_page_with_selectolax(html: bytes, scan_ingredients: bool):
+    """Return the AH page title, lazy per-selector ingredient texts and a page text reader, using selectolax."""
+    tree = LexborHTMLParser(html)
+
+    title = "AH Recept"
+    for selector, _ in _AH_PAGE_TITLE_MATCHERS:
+        title_node = tree.css_first(selector)
+        if title_node:
+            title = title_node.text().strip()
+            break
+
+    def read_page_text() -> str:
+        # BeautifulSoup's get_text() leaves out script and style contents, so drop them first
+        tree.strip_tags(['script', 'style'])
+        return tree.root.text()
+
+    if scan_ingredients:
+        ingredient_matches = (
+            (selector, [node.text() for node in tree.css(selector)])
+            for selector, _ in _AH_PAGE_INGREDIENT_MATCHERS
+        )
+    else:
+        ingredient_matches = ()
+
+    return title, ingredient_matches, read_page_text
+
+def _select_ah_page_with_soup(html: bytes, scan_ingredients: bool):
+    """Return the AH page title, per-selector ingredient texts and a page text reader, using BeautifulSoup."""
+    soup = make_soup(html)
+
+    title = "AH Recept"
+    for _, matcher in _AH_PAGE_TITLE_MATCHERS:
+        title_elem = matcher.select_one(soup)
+        if title_elem:
+            title = title_elem.get_text().strip()
+            break
+
+    if scan_ingredients:
+        ingredient_matches = [
+            (selector, [element.get_text() for element in elements])
+            for selector, elements in select_per_selector(soup, _AH_PAGE_INGREDIENT_MATCHERS, _AH_PAGE_INGREDIENT_GROUP)
+        ]
+    else:
+        ingredient_matches = []
+
+    return title, ingredient_matches, soup.get_text
+
 def _simulate_ah_navigation(session, url, headers):
     """Simulate human navigation to AH recipe page"""
     try:
         # First visit AH homepage
         logger.debug("Simulating visit to AH homepage")
         session.get("https://www.ah.nl/allerhande", headers=headers, timeout=15)
-        time.sleep(random.uniform(1, 3))
+        _ah_backoff_delay(1, 3)
         
         # Then visit the recipe page
         logger.debug("Navigating to recipe page")
@@ -872,11 +1446,8 @@ def _simulate_ah_navigation(session, url, headers):
         # Fallback to direct request
         return session.get(url, headers=headers, timeout=25)
 
-def scrape_with_selenium(url: str) -> Tuple[List[str], str]:
-    """Scrape using Selenium for dynamic content."""
-    if not SELENIUM_AVAILABLE:
-        raise Exception("Selenium niet beschikbaar")
-
+def _build_selenium_options():
+    """Build the Chrome options shared by every pooled scrape_with_selenium driver."""
     options = Options()
     options.add_argument('--headless')
     options.add_argument('--no-sandbox')
@@ -888,44 +1459,94 @@ def scrape_with_selenium(url: str) -> Tuple[List[str], str]:
     options.add_argument('--disable-features=VizDisplayCompositor')
     options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36')
     options.add_argument('--window-size=1920,1080')
-    # Add longer page load timeout
-    options.add_argument('--page-load-strategy=normal')
+
+    # Skip Chrome features that recipe pages don't need to cut launch time and memory
+    for flag in (
+        '--disable-background-networking',
+        '--disable-default-apps',
+        '--disable-sync',
+        '--disable-translate',
+        '--metrics-recording-only',
+        '--mute-audio',
+        '--no-first-run',
+        '--safebrowsing-disable-auto-update',
+        '--blink-settings=imagesEnabled=false'
+    ):
+        options.add_argument(flag)
+    options.add_experimental_option("prefs", _SELENIUM_CONTENT_PREFS)
+
+    # Return as soon as the DOM is ready instead of waiting for images and fonts
+    options.page_load_strategy = 'eager'
+
+    return options
+
+# Chrome options are identical for every pooled driver, so they are built once
+_SELENIUM_OPTIONS = _build_selenium_options() if SELENIUM_AVAILABLE else None
+
+def _create_selenium_driver():
+    """Start a new headless Chrome driver for scrape_with_selenium."""
+    return webdriver.Chrome(options=_SELENIUM_OPTIONS)
+
+# Drivers kept alive between scrape_with_selenium calls
+_SELENIUM_DRIVER_POOL = _DriverPool("Selenium", _create_selenium_driver, 2)
+
+@atexit.register
+def _shutdown_driver_pools() -> None:
+    """Quit all pooled Chrome drivers when the process exits."""
+    for pool in (_EVASION_DRIVER_POOL, _SELENIUM_DRIVER_POOL):
+        pool.shutdown()
+
+# Ingredient selectors for rendered pages; the group lets one wait cover all of them
+_SELENIUM_INGREDIENT_SELECTORS = (
+    '.recipe-ingredient',
+    '.ingredient',
+    '.ingredients li',
+    '[data-ingredient]'
+)
+_SELENIUM_INGREDIENT_SELECTOR_GROUP = ', '.join(_SELENIUM_INGREDIENT_SELECTORS)
+
+# Collects the rendered text of every selector's matches in the browser, in one WebDriver round-trip
+_SELENIUM_INGREDIENT_TEXT_SCRIPT = (
+    "return arguments[0].map(selector => "
+    "Array.from(document.querySelectorAll(selector), element => element.innerText || ''));"
+)
+
+def scrape_with_selenium(url: str) -> Tuple[List[str], str]:
+    """Scrape using Selenium for dynamic content."""
+    if not SELENIUM_AVAILABLE:
+        raise Exception("Selenium niet beschikbaar")
 
     driver = None
     try:
-        driver = webdriver.Chrome(options=options)
-        debug.log_selenium_action("Driver created", "Headless Chrome")
+        driver = _SELENIUM_DRIVER_POOL.acquire()
 
         driver.get(url)
         debug.log_selenium_action("Page loaded", url)
 
-        # Wait for page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        # Wait until any ingredient container is rendered instead of just <body>
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _SELENIUM_INGREDIENT_SELECTOR_GROUP))
+            )
+        except TimeoutException:
+            logger.debug(f"No ingredient elements rendered within 10s for {url}")
 
         # Try to find ingredients
-        selectors = [
-            '.recipe-ingredient',
-            '.ingredient',
-            '.ingredients li',
-            '[data-ingredient]'
-        ]
-
         ingredients = []
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) > 2:
-                            ingredients.append(text)
+        try:
+            texts_per_selector = driver.execute_script(_SELENIUM_INGREDIENT_TEXT_SCRIPT, list(_SELENIUM_INGREDIENT_SELECTORS))
+        except Exception as e:
+            logger.debug(f"Selenium ingredient lookup failed: {e}")
+            texts_per_selector = []
 
-                    if len(ingredients) >= 3:
-                        break
-            except Exception as e:
-                logger.debug(f"Selenium selector {selector} failed: {e}")
+        for texts in texts_per_selector:
+            for text in texts:
+                text = text.strip()
+                if text and len(text) > 2:
+                    ingredients.append(text)
+
+            if len(ingredients) >= 3:
+                break
 
         # Get title
         title = "Onbekend recept"
@@ -938,15 +1559,57 @@ def scrape_with_selenium(url: str) -> Tuple[List[str], str]:
             except:
                 pass
 
-        if not ingredients:
-            raise Exception("Geen ingrediënten gevonden met Selenium")
+        if not ingredients:
+            raise Exception("Geen ingrediënten gevonden met Selenium")
+
+        return ingredients, title
+
+    finally:
+        if driver:
+            _SELENIUM_DRIVER_POOL.release(driver)
+
+# Scraping method chains as (name, function, reads_shared_page); the page-reading
+# methods get the once-fetched recipe HTML as their second argument
+_GENERIC_SCRAPE_METHOD_CHAIN = (
+    ("requests_json_ld", scrape_with_requests_json_ld, True),
+    ("requests_patterns", scrape_with_requests_patterns, True),
+    ("selenium", scrape_with_selenium, False),
+)
+_AH_SCRAPE_METHOD_CHAIN = (("ah_specific", scrape_ah_specific, False),) + _GENERIC_SCRAPE_METHOD_CHAIN
+
+_AH_SPECIFIC_METHOD_CHAIN = (
+    ("Proxy Rotation", scrape_ah_with_proxy_rotation),
+    ("API Endpoints", scrape_ah_via_api_endpoints),
+    ("Browser Evasion", scrape_ah_with_browser_automation_evasion),
+    ("Original Method", scrape_ah_original_method),
+)
+
+# Patterns that suggest ingredient lines
+_INGREDIENT_LINE_PATTERN_SOURCES = (
+    r'^\d+(?:\.\d+)?\s*(gram|g|kg|ml|l|el|tl|stuks?|blik|pak)',  # Amount + unit
+    r'^½\d*\.?\d*\s*\w+',  # Fractions like ½ or ½0.5
+    r'^\d+(?:\.\d+)?\s*[^\d\s]',  # Number followed by text
+    r'^-\s*\d*\s*[^\d]',  # Dash lists
+    r'^\*\s*\d*\s*[^\d]',  # Bullet lists
+    r'^\d+\.\s*\d*\s*[^\d]',  # Numbered lists
+)
+# All line patterns fused into one alternation so each line is scanned once
+_INGREDIENT_LINE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _INGREDIENT_LINE_PATTERN_SOURCES), re.IGNORECASE)
+
+# Common ingredient words; a line containing any of them is likely an ingredient
+_INGREDIENT_WORDS = ('gram', 'g', 'kg', 'ml', 'l', 'liter', 'eetlepel', 'el', 'theelepel', 'tl', 'stuks', 'blik', 'pak', 'snufje', 'snufjes', 'takje', 'takjes')
+_INGREDIENT_WORD_RE = compile_keyword_matcher(_INGREDIENT_WORDS)
 
-        return ingredients, title
+# Whole lines of text extracted from pasted HTML that mention a unit or a common ingredient
+_HTML_TEXT_INGREDIENT_LINE_RE = re.compile(
+    r'^[^\n]*(?:gram|g|kg|ml|l|el|tl|stuks|blik|pak|uien|gehakt|tomaten|room)[^\n]*',
+    re.IGNORECASE | re.MULTILINE
+)
 
-    finally:
-        if driver:
-            driver.quit()
-            debug.log_selenium_action("Driver closed", "Cleanup completed")
+# Markup fragments (already lowercase) that give away pasted HTML, for the whole text and per line
+_HTML_INDICATORS = ('<div', '<input', '<button', '<label', '<textarea', '<span', 'class=', 'id=', 'aria-')
+_HTML_LIKE_PATTERNS = ('class=', 'id=', 'data-', 'aria-', '</', 'div>', 'button>', 'input>', 'onclick', 'style=')
+_HTML_ARTIFACT_PATTERNS = ('onclick', 'javascript:', 'return false', 'class=', 'id=', 'data-', 'aria-')
 
 def extract_ingredients_from_text(text: str) -> List[str]:
     """Extract ingredients from direct text input with smart duplicate handling."""
@@ -962,19 +1625,21 @@ def extract_ingredients_from_text(text: str) -> List[str]:
         if html_tag_count > (lines_count * 0.3):
             logger.info("Text appears to be HTML, attempting to extract text content")
             try:
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(text, 'html.parser')
-
-                # Extract all text content and split into lines
-                extracted_text = soup.get_text(separator='\n')
+                # Extract all text content, one line per text node
+                if SELECTOLAX_AVAILABLE:
+                    tree = LexborHTMLParser(text)
+                    # BeautifulSoup's get_text() leaves out script and style contents, so drop them first
+                    tree.strip_tags(['script', 'style'])
+                    extracted_text = tree.root.text(separator='\n') if tree.root is not None else ''
+                else:
+                    extracted_text = make_soup(text).get_text(separator='\n')
                 potential_ingredients = []
 
-                for line in extracted_text.split('\n'):
-                    line = line.strip()
-                    if line and len(line) > 2:
-                        # Check if line looks like an ingredient
-                        if any(pattern in line.lower() for pattern in ['gram', 'g', 'kg', 'ml', 'l', 'el', 'tl', 'stuks', 'blik', 'pak', 'uien', 'gehakt', 'tomaten', 'room']):
-                            potential_ingredients.append(line)
+                # Only lines that look like an ingredient come out of the scan
+                for match in _HTML_TEXT_INGREDIENT_LINE_RE.finditer(extracted_text):
+                    line = match.group().strip()
+                    if len(line) > 2:
+                        potential_ingredients.append(line)
 
                 if len(potential_ingredients) >= 2:
                     logger.info(f"Extracted {len(potential_ingredients)} ingredients from HTML")
@@ -989,8 +1654,8 @@ def extract_ingredients_from_text(text: str) -> List[str]:
                 raise Exception("Deze tekst bevat HTML-code. Plak alleen de recept ingrediënten of instructies, geen HTML-code.")
 
     # Check for common HTML elements that indicate this is still HTML after processing
-    html_indicators = ['<div', '<input', '<button', '<label', '<textarea', '<span', 'class=', 'id=', 'aria-']
-    html_indicator_count = sum(1 for indicator in html_indicators if indicator.lower() in text.lower())
+    text_lower = text.lower()
+    html_indicator_count = sum(1 for indicator in _HTML_INDICATORS if indicator in text_lower)
 
     if html_indicator_count >= 3:
         logger.warning("Text still contains multiple HTML indicators after processing")
@@ -1001,7 +1666,9 @@ def extract_ingredients_from_text(text: str) -> List[str]:
 
     # Clean and deduplicate lines
     cleaned_lines = []
-    seen_ingredients = set()
+    # Kept lines that have measurements, lowercased and newline-joined so one substring
+    # search covers all of them (names never contain a newline, so no false hits)
+    measured_lines_text = ''
 
     for line in lines:
         if not line or len(line) < 3:
@@ -1016,36 +1683,18 @@ def extract_ingredients_from_text(text: str) -> List[str]:
             ingredient_name = extract_ingredient_name_only(cleaned_line)
 
             # Skip if we already have this ingredient name with measurements
-            skip_duplicate = False
-            for seen_name in seen_ingredients:
-                if ingredient_name.lower() in seen_name.lower() and has_measurements(seen_name):
-                    skip_duplicate = True
-                    break
+            if measured_lines_text and ingredient_name.lower() in measured_lines_text:
+                continue
 
-            if not skip_duplicate:
-                cleaned_lines.append(cleaned_line)
-                seen_ingredients.add(cleaned_line)
-
-    # Patterns that suggest ingredient lines
-    ingredient_patterns = [
-        r'^\d+(?:\.\d+)?\s*(gram|g|kg|ml|l|el|tl|stuks?|blik|pak)',  # Amount + unit
-        r'^½\d*\.?\d*\s*\w+',  # Fractions like ½ or ½0.5
-        r'^\d+(?:\.\d+)?\s*[^\d\s]',  # Number followed by text
-        r'^-\s*\d*\s*[^\d]',  # Dash lists
-        r'^\*\s*\d*\s*[^\d]',  # Bullet lists
-        r'^\d+\.\s*\d*\s*[^\d]',  # Numbered lists
-    ]
+            cleaned_lines.append(cleaned_line)
+            if has_measurements(cleaned_line):
+                measured_lines_text += '\n' + cleaned_line.lower()
 
     ingredients = []
     for line in cleaned_lines:
-        # Check if line matches ingredient patterns
-        is_ingredient = any(re.match(pattern, line, re.IGNORECASE) for pattern in ingredient_patterns)
-
-        # Also include lines that contain common ingredient words
-        ingredient_words = ['gram', 'g', 'kg', 'ml', 'l', 'liter', 'eetlepel', 'el', 'theelepel', 'tl', 'stuks', 'blik', 'pak', 'snufje', 'snufjes', 'takje', 'takjes']
-        contains_ingredient_word = any(word in line.lower() for word in ingredient_words)
-
-        if is_ingredient or contains_ingredient_word:
+        # Keep lines that match an ingredient pattern or contain a common ingredient word;
+        # the word scan only runs when the anchored pattern did not match
+        if _INGREDIENT_LINE_RE.match(line) or _INGREDIENT_WORD_RE.search(line):
             ingredients.append(line)
 
     # If no pattern matches found, use all cleaned lines
@@ -1059,7 +1708,7 @@ def extract_ingredients_from_text(text: str) -> List[str]:
     # Check if all "ingredients" are suspiciously similar (like HTML attributes)
     if len(ingredients) > 10:
         # Count how many contain common HTML patterns
-        html_like_count = sum(1 for ing in ingredients if any(pattern in ing.lower() for pattern in ['class=', 'id=', 'data-', 'aria-', '</', 'div>', 'button>', 'input>', 'onclick', 'style=']))
+        html_like_count = sum(1 for ing in map(str.lower, ingredients) if any(pattern in ing for pattern in _HTML_LIKE_PATTERNS))
 
         if html_like_count > (len(ingredients) * 0.3):
             logger.warning(f"Found {html_like_count} HTML-like ingredients out of {len(ingredients)} total")
@@ -1070,7 +1719,7 @@ def extract_ingredients_from_text(text: str) -> List[str]:
     for ing in ingredients:
         ing_lower = ing.lower()
         # Skip obvious HTML artifacts
-        if any(html_pattern in ing_lower for html_pattern in ['onclick', 'javascript:', 'return false', 'class=', 'id=', 'data-', 'aria-']):
+        if any(html_pattern in ing_lower for html_pattern in _HTML_ARTIFACT_PATTERNS):
             continue
         # Skip very short or suspicious entries
         if len(ing) < 3 or ing.isdigit():
@@ -1088,230 +1737,247 @@ def extract_ingredients_from_text(text: str) -> List[str]:
     logger.info(f"Extracted {len(ingredients)} ingredients from text after cleaning")
     return ingredients
 
+# Copy-paste cleanup patterns for clean_ingredient_line
+# aantal+eenheid+aantal+spatie+eenheid (bijv. "500g500 gram")
+_REPEATED_UNIT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(g|kg|ml|l|el|tl|gram|kilogram|liter|eetlepel|theelepel)\d+\s+(gram|kilogram|liter|eetlepel|theelepel)')
+# aantal+eenheid+aantal+eenheid (bijv. "3el3 eetlepel")
+_GLUED_REPEATED_UNIT_RE = re.compile(r'(\d+(?:\.\d+)?)(el|tl|g|kg|ml|l)\d+\s+(eetlepel|theelepel|gram|kilogram|liter)')
+# ½aantal -> 0.5
+_HALF_AMOUNT_RE = re.compile(r'½(\d+(?:\.\d+)?)')
+
 def clean_ingredient_line(line: str) -> str:
     """Clean ingredient line from copy-paste formatting issues."""
     # Fix common AH.nl copy-paste issues like "500g500 gram" -> "500 gram"
-
-    # Pattern: aantal+eenheid+aantal+spatie+eenheid (bijv. "500g500 gram")
-    line = re.sub(r'(\d+(?:\.\d+)?)\s*(g|kg|ml|l|el|tl|gram|kilogram|liter|eetlepel|theelepel)\d+\s+(gram|kilogram|liter|eetlepel|theelepel)', r'\1 \3', line)
-
-    # Pattern: aantal+eenheid+aantal+eenheid (bijv. "3el3 eetlepel")
-    line = re.sub(r'(\d+(?:\.\d+)?)(el|tl|g|kg|ml|l)\d+\s+(eetlepel|theelepel|gram|kilogram|liter)', r'\1 \3', line)
-
-    # Pattern: ½aantal -> ½ aantal
-    line = re.sub(r'½(\d+(?:\.\d+)?)', r'0.5', line)
+    line = _REPEATED_UNIT_RE.sub(r'\1 \3', line)
+    line = _GLUED_REPEATED_UNIT_RE.sub(r'\1 \3', line)
+    line = _HALF_AMOUNT_RE.sub(r'0.5', line)
 
     # Clean up multiple spaces
-    line = re.sub(r'\s+', ' ', line).strip()
+    line = _WHITESPACE_RE.sub(' ', line).strip()
 
     return line
 
+# Leading measurements stripped by extract_ingredient_name_only, in order
+_LEADING_AMOUNT_UNIT_RE = re.compile(r'^\d+(?:\.\d+)?\s*(gram|g|kg|ml|l|el|tl|eetlepel|theelepel|stuks?|blik|pak)\s*', re.IGNORECASE)
+_LEADING_HALF_RE = re.compile(r'^½\d*\.?\d*\s*')
+_LEADING_AMOUNT_RE = re.compile(r'^\d+(?:\.\d+)?\s*')
+
 def extract_ingredient_name_only(line: str) -> str:
     """Extract just the ingredient name without measurements."""
     # Remove common measurement patterns to get just the ingredient name
-    clean_line = re.sub(r'^\d+(?:\.\d+)?\s*(gram|g|kg|ml|l|el|tl|eetlepel|theelepel|stuks?|blik|pak)\s*', '', line, flags=re.IGNORECASE)
-    clean_line = re.sub(r'^½\d*\.?\d*\s*', '', clean_line)
-    clean_line = re.sub(r'^\d+(?:\.\d+)?\s*', '', clean_line)
+    clean_line = _LEADING_AMOUNT_UNIT_RE.sub('', line)
+    clean_line = _LEADING_HALF_RE.sub('', clean_line)
+    clean_line = _LEADING_AMOUNT_RE.sub('', clean_line)
     return clean_line.strip()
 
+_MEASUREMENT_RE = re.compile(r'\d+(?:\.\d+)?\s*(gram|g|kg|ml|l|el|tl|eetlepel|theelepel|stuks?|blik|pak)', re.IGNORECASE)
+
 def has_measurements(line: str) -> bool:
     """Check if line contains measurements."""
-    measurement_pattern = r'\d+(?:\.\d+)?\s*(gram|g|kg|ml|l|el|tl|eetlepel|theelepel|stuks?|blik|pak)'
-    return bool(re.search(measurement_pattern, line, re.IGNORECASE))
-
+    return bool(_MEASUREMENT_RE.search(line))
+
+# English ingredient names and their Dutch translation; partial matches use this order
+_INGREDIENT_TRANSLATIONS = {
+    # Basis ingrediënten
+    'flour': 'bloem',
+    'all-purpose flour': 'bloem (patent)',
+    'sugar': 'suiker',
+    'granulated sugar': 'kristalsuiker',
+    'brown sugar': 'bruine suiker',
+    'butter': 'boter',
+    'eggs': 'eieren',
+    'egg': 'ei',
+    'milk': 'melk',
+    'salt': 'zout',
+    'baking powder': 'bakpoeder',
+    'baking soda': 'zuiveringszout',
+    'vanilla': 'vanille',
+    'vanilla extract': 'vanille-extract',
+    'oil': 'olie',
+    'vegetable oil': 'plantaardige olie',
+    'olive oil': 'olijfolie',
+    'water': 'water',
+    'cream': 'room',
+    'heavy cream': 'slagroom',
+    'sour cream': 'zure room',
+    'cream cheese': 'roomkaas',
+    'cheese': 'kaas',
+    'cheddar cheese': 'cheddar kaas',
+    'parmesan cheese': 'parmezaanse kaas',
+
+    # Fruit
+    'banana': 'banaan',
+    'bananas': 'bananen',
+    'apple': 'appel',
+    'apples': 'appels',
+    'orange': 'sinaasappel',
+    'lemon': 'citroen',
+    'lime': 'limoen',
+    'pineapple': 'ananas',
+    'strawberry': 'aardbei',
+    'strawberries': 'aardbeien',
+    'blueberry': 'bosbes',
+    'blueberries': 'bosbessen',
+    'raspberry': 'framboos',
+    'raspberries': 'frambozen',
+    'peach': 'perzik',
+    'peaches': 'perziken',
+    'pear': 'peer',
+    'pears': 'peren',
+
+    # Groenten
+    'onion': 'ui',
+    'onions': 'uien',
+    'garlic': 'knoflook',
+    'tomato': 'tomaat',
+    'tomatoes': 'tomaten',
+    'carrot': 'wortel',
+    'carrots': 'wortels',
+    'potato': 'aardappel',
+    'potatoes': 'aardappels',
+    'bell pepper': 'paprika',
+    'red bell pepper': 'rode paprika',
+    'green bell pepper': 'groene paprika',
+    'cucumber': 'komkommer',
+    'lettuce': 'sla',
+    'spinach': 'spinazie',
+    'broccoli': 'broccoli',
+    'cauliflower': 'bloemkool',
+    'mushroom': 'champignon',
+    'mushrooms': 'champignons',
+
+    # Vlees en vis
+    'chicken': 'kip',
+    'chicken breast': 'kipfilet',
+    'beef': 'rundvlees',
+    'ground beef': 'gehakt',
+    'pork': 'varkensvlees',
+    'bacon': 'spek',
+    'ham': 'ham',
+    'fish': 'vis',
+    'salmon': 'zalm',
+    'tuna': 'tonijn',
+    'shrimp': 'garnalen',
+
+    # Noten en zaden
+    'nuts': 'noten',
+    'almonds': 'amandelen',
+    'walnuts': 'walnoten',
+    'peanuts': 'pinda\'s',
+    'cashews': 'cashewnoten',
+    'pine nuts': 'pijnboompitten',
+    'sunflower seeds': 'zonnebloempitten',
+    'pumpkin seeds': 'pompoenpitten',
+
+    # Kruiden en specerijen
+    'pepper': 'peper',
+    'black pepper': 'zwarte peper',
+    'paprika': 'paprikapoeder',
+    'cumin': 'komijn',
+    'oregano': 'oregano',
+    'basil': 'basilicum',
+    'thyme': 'tijm',
+    'rosemary': 'rozemarijn',
+    'parsley': 'peterselie',
+    'cilantro': 'koriander',
+    'dill': 'dille',
+    'sage': 'salie',
+    'cinnamon': 'kaneel',
+    'nutmeg': 'nootmuskaat',
+    'ginger': 'gember',
+    'turmeric': 'kurkuma',
+
+    # Granen en pasta
+    'rice': 'rijst',
+    'bread': 'brood',
+    'pasta': 'pasta',
+    'spaghetti': 'spaghetti',
+    'noodles': 'noedels',
+    'oats': 'haver',
+    'quinoa': 'quinoa',
+    'barley': 'gerst',
+
+    # Peulvruchten
+    'beans': 'bonen',
+    'black beans': 'zwarte bonen',
+    'kidney beans': 'kidneybonen',
+    'chickpeas': 'kikkererwten',
+    'lentils': 'linzen',
+    'peas': 'erwten',
+
+    # Overig
+    'chocolate': 'chocolade',
+    'cocoa powder': 'cacaopoeder',
+    'honey': 'honing',
+    'maple syrup': 'ahornsiroop',
+    'vinegar': 'azijn',
+    'wine': 'wijn',
+    'beer': 'bier',
+    'stock': 'bouillon',
+    'broth': 'bouillon',
+    'chicken stock': 'kippenbouillon',
+    'vegetable stock': 'groentebouillon',
+    'soy sauce': 'sojasaus',
+    'worcestershire sauce': 'worcestersaus',
+    'hot sauce': 'hete saus',
+    'ketchup': 'ketchup',
+    'mayonnaise': 'mayonaise',
+    'mustard': 'mosterd',
+    'jam': 'jam',
+    'jelly': 'gelei',
+    'peanut butter': 'pindakaas',
+}
+_INGREDIENT_TRANSLATION_ITEMS = tuple(_INGREDIENT_TRANSLATIONS.items())
+
+@lru_cache(maxsize=2048)
 def translate_ingredient_to_dutch(ingredient_name):
     """Vertaal ingrediënt naar Nederlands"""
-    translations = {
-        # Basis ingrediënten
-        'flour': 'bloem',
-        'all-purpose flour': 'bloem (patent)',
-        'sugar': 'suiker',
-        'granulated sugar': 'kristalsuiker',
-        'brown sugar': 'bruine suiker',
-        'butter': 'boter',
-        'eggs': 'eieren',
-        'egg': 'ei',
-        'milk': 'melk',
-        'salt': 'zout',
-        'baking powder': 'bakpoeder',
-        'baking soda': 'zuiveringszout',
-        'vanilla': 'vanille',
-        'vanilla extract': 'vanille-extract',
-        'oil': 'olie',
-        'vegetable oil': 'plantaardige olie',
-        'olive oil': 'olijfolie',
-        'water': 'water',
-        'cream': 'room',
-        'heavy cream': 'slagroom',
-        'sour cream': 'zure room',
-        'cream cheese': 'roomkaas',
-        'cheese': 'kaas',
-        'cheddar cheese': 'cheddar kaas',
-        'parmesan cheese': 'parmezaanse kaas',
-
-        # Fruit
-        'banana': 'banaan',
-        'bananas': 'bananen',
-        'apple': 'appel',
-        'apples': 'appels',
-        'orange': 'sinaasappel',
-        'lemon': 'citroen',
-        'lime': 'limoen',
-        'pineapple': 'ananas',
-        'strawberry': 'aardbei',
-        'strawberries': 'aardbeien',
-        'blueberry': 'bosbes',
-        'blueberries': 'bosbessen',
-        'raspberry': 'framboos',
-        'raspberries': 'frambozen',
-        'peach': 'perzik',
-        'peaches': 'perziken',
-        'pear': 'peer',
-        'pears': 'peren',
-
-        # Groenten
-        'onion': 'ui',
-        'onions': 'uien',
-        'garlic': 'knoflook',
-        'tomato': 'tomaat',
-        'tomatoes': 'tomaten',
-        'carrot': 'wortel',
-        'carrots': 'wortels',
-        'potato': 'aardappel',
-        'potatoes': 'aardappels',
-        'bell pepper': 'paprika',
-        'red bell pepper': 'rode paprika',
-        'green bell pepper': 'groene paprika',
-        'cucumber': 'komkommer',
-        'lettuce': 'sla',
-        'spinach': 'spinazie',
-        'broccoli': 'broccoli',
-        'cauliflower': 'bloemkool',
-        'mushroom': 'champignon',
-        'mushrooms': 'champignons',
-
-        # Vlees en vis
-        'chicken': 'kip',
-        'chicken breast': 'kipfilet',
-        'beef': 'rundvlees',
-        'ground beef': 'gehakt',
-        'pork': 'varkensvlees',
-        'bacon': 'spek',
-        'ham': 'ham',
-        'fish': 'vis',
-        'salmon': 'zalm',
-        'tuna': 'tonijn',
-        'shrimp': 'garnalen',
-
-        # Noten en zaden
-        'nuts': 'noten',
-        'almonds': 'amandelen',
-        'walnuts': 'walnoten',
-        'peanuts': 'pinda\'s',
-        'cashews': 'cashewnoten',
-        'pine nuts': 'pijnboompitten',
-        'sunflower seeds': 'zonnebloempitten',
-        'pumpkin seeds': 'pompoenpitten',
-
-        # Kruiden en specerijen
-        'pepper': 'peper',
-        'black pepper': 'zwarte peper',
-        'paprika': 'paprikapoeder',
-        'cumin': 'komijn',
-        'oregano': 'oregano',
-        'basil': 'basilicum',
-        'thyme': 'tijm',
-        'rosemary': 'rozemarijn',
-        'parsley': 'peterselie',
-        'cilantro': 'koriander',
-        'dill': 'dille',
-        'sage': 'salie',
-        'cinnamon': 'kaneel',
-        'nutmeg': 'nootmuskaat',
-        'ginger': 'gember',
-        'turmeric': 'kurkuma',
-
-        # Granen en pasta
-        'rice': 'rijst',
-        'bread': 'brood',
-        'pasta': 'pasta',
-        'spaghetti': 'spaghetti',
-        'noodles': 'noedels',
-        'oats': 'haver',
-        'quinoa': 'quinoa',
-        'barley': 'gerst',
-
-        # Peulvruchten
-        'beans': 'bonen',
-        'black beans': 'zwarte bonen',
-        'kidney beans': 'kidneybonen',
-        'chickpeas': 'kikkererwten',
-        'lentils': 'linzen',
-        'peas': 'erwten',
-
-        # Overig
-        'chocolate': 'chocolade',
-        'cocoa powder': 'cacaopoeder',
-        'honey': 'honing',
-        'maple syrup': 'ahornsiroop',
-        'vinegar': 'azijn',
-        'wine': 'wijn',
-        'beer': 'bier',
-        'stock': 'bouillon',
-        'broth': 'bouillon',
-        'chicken stock': 'kippenbouillon',
-        'vegetable stock': 'groentebouillon',
-        'soy sauce': 'sojasaus',
-        'worcestershire sauce': 'worcestersaus',
-        'hot sauce': 'hete saus',
-        'ketchup': 'ketchup',
-        'mayonnaise': 'mayonaise',
-        'mustard': 'mosterd',
-        'jam': 'jam',
-        'jelly': 'gelei',
-        'peanut butter': 'pindakaas',
-    }
-
     # Maak lowercase voor matching
-    name_lower = ingredient_name.lower().strip()
+    lowered = ingredient_name.lower()
+    name_lower = lowered.strip()
 
     # Directe match
-    if name_lower in translations:
-        return translations[name_lower]
+    translation = _INGREDIENT_TRANSLATIONS.get(name_lower)
+    if translation is not None:
+        return translation
 
     # Probeer gedeeltelijke matches voor samengestelde ingrediënten
-    for eng_term, dutch_term in translations.items():
+    for eng_term, dutch_term in _INGREDIENT_TRANSLATION_ITEMS:
         if eng_term in name_lower:
-            return ingredient_name.lower().replace(eng_term, dutch_term)
+            return lowered.replace(eng_term, dutch_term)
 
     # Als geen vertaling gevonden, return origineel
     return ingredient_name
 
+_TRAILING_S_RE = re.compile(r's$')
+_NON_LETTER_RE = re.compile(r'[^a-z\s]')
+
+@lru_cache(maxsize=2048)
 def normalize_ingredient_name(name):
     """Normalize ingredient name."""
     name = name.lower()
     # Remove plurals and special characters
-    name = re.sub(r's$', '', name)
-    name = re.sub(r'[^a-z\s]', '', name)
+    name = _TRAILING_S_RE.sub('', name)
+    name = _NON_LETTER_RE.sub('', name)
     return name.strip()
 
 def find_substitution(ingredient_name: str, substitutions_db: Dict[str, Any]) -> Dict[str, Any]:
     """Find ingredient substitution in the database."""
-    # Fuzzy search for the ingredient
-    best_match = None
-    best_score = 0
-
-    for key in substitutions_db.keys():
-        score = fuzz.ratio(ingredient_name, key)
-        if score > best_score:
-            best_score = score
-            best_match = key
+    best_match = _best_substitution_key(ingredient_name, tuple(substitutions_db))
 
-    if best_score > 70:
+    if best_match is not None:
         return substitutions_db[best_match]
     else:
         return {}
 
+@lru_cache(maxsize=2048)
+def _best_substitution_key(ingredient_name: str, candidates: Tuple[str, ...]) -> Optional[str]:
+    """Return the closest substitution key scoring above 70, memoized per name and key set."""
+    # Fuzzy search for the ingredient; extractOne keeps the first of equally good keys
+    best = process.extractOne(ingredient_name, candidates, scorer=fuzz.ratio, score_cutoff=70)
+
+    return best[0] if best and best[1] > 70 else None
+
 def calculate_health_score(ingredient_name: str, substitution_data: Dict[str, Any]) -> int:
     """Calculate health score for an ingredient."""
     if substitution_data:
@@ -1329,6 +1995,10 @@ def process_recipe_ingredients(ingredients: List[str], substitutions_db: Dict[st
     """Process recipe ingredients, normalize names, and calculate health scores."""
     processed_ingredients = []
 
+    # Ingrediënten met dezelfde genormaliseerde naam krijgen hetzelfde resultaat,
+    # dus de substitutie-zoektocht en vertaling doen we maar één keer per naam
+    processed_by_name = {}
+
     # Verwerk elk ingredient
     for ingredient in ingredients:
         try:
@@ -1342,25 +2012,28 @@ def process_recipe_ingredients(ingredients: List[str], substitutions_db: Dict[st
             if not normalized_name:
                 continue
 
-            # Zoek in substitutie database
-            substitution_data = find_substitution(normalized_name, substitutions_db)
+            ingredient_obj = processed_by_name.get(normalized_name)
+            if ingredient_obj is None:
+                # Zoek in substitutie database
+                substitution_data = find_substitution(normalized_name, substitutions_db)
 
-            # Bereken health score
-            health_score = calculate_health_score(normalized_name, substitution_data)
+                # Bereken health score
+                health_score = calculate_health_score(normalized_name, substitution_data)
 
-            # Force translation to Dutch
-            dutch_name = translate_to_dutch(normalized_name)
+                # Force translation to Dutch
+                dutch_name = translate_to_dutch(normalized_name)
 
-            # Create ingredient object with health score
-            ingredient_obj = {
-                "name": dutch_name,
-                "health_score": health_score,
-                "details": substitution_data.get('details', ''),
-                "health_fact": substitution_data.get('health_fact', ''),
-                "substitution": substitution_data.get('substitution', '')
-            }
+                # Create ingredient object with health score
+                ingredient_obj = {
+                    "name": dutch_name,
+                    "health_score": health_score,
+                    "details": substitution_data.get('details', ''),
+                    "health_fact": substitution_data.get('health_fact', ''),
+                    "substitution": substitution_data.get('substitution', '')
+                }
+                processed_by_name[normalized_name] = ingredient_obj
 
-            processed_ingredients.append(ingredient_obj)
+            processed_ingredients.append(dict(ingredient_obj))
 
         except Exception as e:
             logger.warning(f"Error processing ingredient '{ingredient}': {e}")
@@ -1368,6 +2041,47 @@ def process_recipe_ingredients(ingredients: List[str], substitutions_db: Dict[st
 
     return processed_ingredients
 
+# Keyword matchers for the health score of a single ingredient
+_HEALTHY_KEYWORDS = ('groente', 'fruit', 'volkoren', 'noten', 'vis', 'olijfolie', 'avocado', 'asperges', 'sperziebonen', 'spinazie', 'peterselie', 'radijs', 'nectarine', 'granaatappel')
+_UNHEALTHY_KEYWORDS = ('suiker', 'boter', 'room', 'spek', 'worst', 'gebak', 'friet', 'chips')
+_HEALTHY_KEYWORD_RE = compile_keyword_matcher(_HEALTHY_KEYWORDS)
+_UNHEALTHY_KEYWORD_RE = compile_keyword_matcher(_UNHEALTHY_KEYWORDS)
+
+# Special-case keywords that fix the score outright, in order of precedence
+_SPECIAL_KEYWORD_SCORES = (
+    (('burrata', 'kaas'), 6),  # Moderate score for cheese
+    (('olijfolie',), 8),  # High score for olive oil
+    (('asperges', 'sperziebonen', 'spinazie', 'radijs'), 9),  # Very high for vegetables
+    (('nectarine', 'granaatappel'), 8),  # High for fruits
+)
+# keyword -> (precedence, score); no keyword can hide a higher-precedence one by overlapping it
+_SPECIAL_KEYWORD_TABLE = {
+    keyword: (precedence, score)
+    for precedence, (keywords, score) in enumerate(_SPECIAL_KEYWORD_SCORES)
+    for keyword in keywords
+}
+_SPECIAL_KEYWORD_RE = compile_keyword_matcher(_SPECIAL_KEYWORD_TABLE)
+
+def keyword_health_score(ingredient_name: str) -> int:
+    """Score an ingredient name from 1 to 10 based on health keywords."""
+    # Special cases decide the score on their own, found in one scan
+    special_cases = [_SPECIAL_KEYWORD_TABLE[match.group().lower()] for match in _SPECIAL_KEYWORD_RE.finditer(ingredient_name)]
+    if special_cases:
+        return min(special_cases)[1]
+
+    # Simple health scoring based on keywords
+    health_score = 5  # Default neutral score
+
+    # Check for healthy keywords
+    if _HEALTHY_KEYWORD_RE.search(ingredient_name):
+        health_score = min(10, health_score + 2)
+
+    # Check for unhealthy keywords
+    if _UNHEALTHY_KEYWORD_RE.search(ingredient_name):
+        health_score = max(1, health_score - 2)
+
+    return health_score
+
 def analyze_ingredient(ingredient_text: str) -> Dict[str, Any]:
     """Analyze a single ingredient for health scoring with structured parsing."""
     if not ingredient_text or not isinstance(ingredient_text, str):
@@ -1398,35 +2112,7 @@ def analyze_ingredient(ingredient_text: str) -> Dict[str, Any]:
     # Get nutrition data from multiple sources
     nutrition_data = get_enhanced_nutrition_data(clean_ingredient, quantity, unit)
 
-    # Simple health scoring based on keywords
-    healthy_keywords = ['groente', 'fruit', 'volkoren', 'noten', 'vis', 'olijfolie', 'avocado', 'asperges', 'sperziebonen', 'spinazie', 'peterselie', 'radijs', 'nectarine', 'granaatappel']
-    unhealthy_keywords = ['suiker', 'boter', 'room', 'spek', 'worst', 'gebak', 'friet', 'chips']
-
-    health_score = 5  # Default neutral score
-
-    ingredient_lower = clean_ingredient.lower()
-
-    # Check for healthy keywords
-    for keyword in healthy_keywords:
-        if keyword in ingredient_lower:
-            health_score = min(10, health_score + 2)
-            break
-
-    # Check for unhealthy keywords
-    for keyword in unhealthy_keywords:
-        if keyword in ingredient_lower:
-            health_score = max(1, health_score - 2)
-            break
-
-    # Special cases
-    if 'burrata' in ingredient_lower or 'kaas' in ingredient_lower:
-        health_score = 6  # Moderate score for cheese
-    elif 'olijfolie' in ingredient_lower:
-        health_score = 8  # High score for olive oil
-    elif any(veg in ingredient_lower for veg in ['asperges', 'sperziebonen', 'spinazie', 'radijs']):
-        health_score = 9  # Very high for vegetables
-    elif any(fruit in ingredient_lower for fruit in ['nectarine', 'granaatappel']):
-        health_score = 8  # High for fruits
+    health_score = keyword_health_score(clean_ingredient)
 
     return {
         'name': clean_ingredient,
@@ -1438,6 +2124,14 @@ def analyze_ingredient(ingredient_text: str) -> Dict[str, Any]:
         'nutrition': nutrition_data
     }
 
+# Nutrition lookups are remote round-trips, so the ingredients of a recipe are analysed concurrently
+_NUTRITION_LOOKUP_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="nutrition-lookup")
+
+def analyze_ingredients(ingredient_texts: List[str]) -> List[Dict[str, Any]]:
+    """Analyze all ingredient lines concurrently, keeping their order."""
+    analyzed = _NUTRITION_LOOKUP_EXECUTOR.map(analyze_ingredient, [text.strip() for text in ingredient_texts])
+    return [ingredient_data for ingredient_data in analyzed if ingredient_data]
+
 def get_enhanced_nutrition_data(ingredient_name: str, quantity: Optional[float] = None, unit: Optional[str] = None) -> Dict[str, Any]:
     """Get nutrition data using multiple sources with fallbacks."""
     
@@ -1461,313 +2155,489 @@ def get_enhanced_nutrition_data(ingredient_name: str, quantity: Optional[float]
     
     return nutrition_data
 
+# Dutch ingredient names translated to English search terms for the nutrition APIs
+_USDA_SEARCH_TRANSLATIONS = {
+    'ui': 'onion', 'uien': 'onions', 'knoflook': 'garlic',
+    'tomaat': 'tomato', 'tomaten': 'tomatoes', 'wortel': 'carrot',
+    'aardappel': 'potato', 'kip': 'chicken', 'rundvlees': 'beef',
+    'gehakt': 'ground beef', 'vis': 'fish', 'spinazie': 'spinach',
+    'paprika': 'bell pepper', 'komkommer': 'cucumber', 'rijst': 'rice',
+    'pasta': 'pasta', 'bloem': 'flour', 'suiker': 'sugar',
+    'boter': 'butter', 'melk': 'milk', 'kaas': 'cheese',
+    'olijfolie': 'olive oil', 'peterselie': 'parsley'
+}
+_OFF_SEARCH_TRANSLATIONS = {
+    **_USDA_SEARCH_TRANSLATIONS,
+    'koriander': 'coriander',
+    'basterdsuiker': 'brown sugar', 'burrata': 'burrata cheese'
+}
+
+class NutritionLookupUnavailable(Exception):
+    """A nutrition API could not be asked (network error or non-200), so the miss is not cached."""
+
 def get_nutrition_from_openfoodfacts_api(ingredient_name: str) -> Dict[str, Any]:
     """Get nutrition data from Open Food Facts API (better for European foods)."""
     try:
-        # Clean ingredient name for search
-        clean_name = ingredient_name.lower().strip()
-        
-        # Try both Dutch and English names
-        search_terms = [clean_name]
-        
-        # Add English translation
-        dutch_to_english = {
-            'ui': 'onion', 'uien': 'onions', 'knoflook': 'garlic',
-            'tomaat': 'tomato', 'tomaten': 'tomatoes', 'wortel': 'carrot',
-            'aardappel': 'potato', 'kip': 'chicken', 'rundvlees': 'beef',
-            'gehakt': 'ground beef', 'vis': 'fish', 'spinazie': 'spinach',
-            'paprika': 'bell pepper', 'komkommer': 'cucumber', 'rijst': 'rice',
-            'pasta': 'pasta', 'bloem': 'flour', 'suiker': 'sugar',
-            'boter': 'butter', 'melk': 'milk', 'kaas': 'cheese',
-            'olijfolie': 'olive oil', 'peterselie': 'parsley', 'koriander': 'coriander',
-            'basterdsuiker': 'brown sugar', 'burrata': 'burrata cheese'
-        }
-        
-        english_name = dutch_to_english.get(clean_name, clean_name)
-        if english_name != clean_name:
-            search_terms.append(english_name)
-        
-        for search_term in search_terms:
-            search_url = f"https://world.openfoodfacts.org/cgi/search.pl"
-            params = {
-                'search_terms': search_term,
-                'search_simple': 1,
-                'action': 'process',
-                'json': 1,
-                'page_size': 1
-            }
-            
-            response = requests.get(search_url, params=params, timeout=8)
-            if response.status_code == 200:
-                data = response.json()
-                
-                if data.get('products') and len(data['products']) > 0:
-                    product = data['products'][0]
-                    nutriments = product.get('nutriments', {})
-                    
-                    nutrition = {
-                        'calories': nutriments.get('energy-kcal_100g', 0),
-                        'protein': nutriments.get('proteins_100g', 0),
-                        'carbs': nutriments.get('carbohydrates_100g', 0),
-                        'fat': nutriments.get('fat_100g', 0),
-                        'fiber': nutriments.get('fiber_100g', 0),
-                        'sodium': nutriments.get('sodium_100g', 0),
-                        'sugar': nutriments.get('sugars_100g', 0)
-                    }
-                    
-                    # Check if we got meaningful data
-                    if any(v > 0 for v in nutrition.values()):
-                        logger.debug(f"Found nutrition data via Open Food Facts for {ingredient_name}")
-                        return nutrition
-        
-        return {}
-        
+        # Copy so callers can scale the values without touching the cached lookup
+        return dict(_lookup_openfoodfacts_nutrition(ingredient_name.lower().strip()))
     except Exception as e:
         logger.debug(f"Open Food Facts API error for {ingredient_name}: {e}")
         return {}
 
-def get_ingredient_nutrition_usda(ingredient_name: str) -> Dict[str, Any]:
-    """Get nutrition data using USDA FoodData Central API."""
-    try:
-        clean_name = ingredient_name.lower().strip()
-        
-        # Translate Dutch to English for USDA API
-        dutch_to_english = {
-            'ui': 'onion', 'uien': 'onions', 'knoflook': 'garlic',
-            'tomaat': 'tomato', 'tomaten': 'tomatoes', 'wortel': 'carrot',
-            'aardappel': 'potato', 'kip': 'chicken', 'rundvlees': 'beef',
-            'gehakt': 'ground beef', 'vis': 'fish', 'spinazie': 'spinach',
-            'paprika': 'bell pepper', 'komkommer': 'cucumber', 'rijst': 'rice',
-            'pasta': 'pasta', 'bloem': 'flour', 'suiker': 'sugar',
-            'boter': 'butter', 'melk': 'milk', 'kaas': 'cheese',
-            'olijfolie': 'olive oil', 'peterselie': 'parsley'
-        }
-        
-        english_name = dutch_to_english.get(clean_name, clean_name)
-        
-        search_url = f"https://api.nal.usda.gov/fdc/v1/foods/search"
+@lru_cache(maxsize=2048)
+def _lookup_openfoodfacts_nutrition(clean_name: str) -> Tuple[Tuple[str, Any], ...]:
+    """Search Open Food Facts for a cleaned name; only answered searches are cached."""
+    # Try both Dutch and English names
+    search_terms = [clean_name]
+    
+    # Add English translation
+    english_name = _OFF_SEARCH_TRANSLATIONS.get(clean_name, clean_name)
+    if english_name != clean_name:
+        search_terms.append(english_name)
+    
+    unanswered = False
+    for search_term in search_terms:
+        search_url = f"https://world.openfoodfacts.org/cgi/search.pl"
         params = {
-            'query': english_name,
-            'dataType': ['Foundation', 'SR Legacy'],
-            'pageSize': 1,
-            'api_key': 'DEMO_KEY'
+            'search_terms': search_term,
+            'search_simple': 1,
+            'action': 'process',
+            'json': 1,
+            'page_size': 1,
+            # Only the nutriments are read, so skip the rest of the product document
+            'fields': 'nutriments'
         }
         
-        response = requests.get(search_url, params=params, timeout=8)
+        response = HTTP_SESSION.get(search_url, params=params, timeout=8)
+        if response.status_code != 200:
+            unanswered = True
+            continue
+
+        data = decode_json_response(response)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data.get('products') and len(data['products']) > 0:
+            product = data['products'][0]
+            nutriments = product.get('nutriments', {})
             
-            if data.get('foods') and len(data['foods']) > 0:
-                food = data['foods'][0]
-                food_nutrients = food.get('foodNutrients', [])
-                
-                nutrition = {
-                    'calories': 0,
-                    'protein': 0,
-                    'carbs': 0,
-                    'fat': 0,
-                    'fiber': 0,
-                    'sodium': 0,
-                    'sugar': 0
-                }
-                
-                nutrient_map = {
-                    1008: 'calories',  # Energy (kcal)
-                    1003: 'protein',   # Protein
-                    1005: 'carbs',     # Carbohydrate
-                    1004: 'fat',       # Total fat
-                    1079: 'fiber',     # Fiber
-                    1093: 'sodium',    # Sodium
-                    2000: 'sugar'      # Total sugars
-                }
-                
-                for nutrient in food_nutrients:
-                    nutrient_id = nutrient.get('nutrientId')
-                    if nutrient_id in nutrient_map:
-                        value = nutrient.get('value', 0)
-                        nutrition[nutrient_map[nutrient_id]] = round(value, 1)
-                
-                if any(v > 0 for v in nutrition.values()):
-                    logger.debug(f"Found nutrition data via USDA for {ingredient_name}")
-                    return nutrition
-                
+            nutrition = {
+                'calories': nutriments.get('energy-kcal_100g', 0),
+                'protein': nutriments.get('proteins_100g', 0),
+                'carbs': nutriments.get('carbohydrates_100g', 0),
+                'fat': nutriments.get('fat_100g', 0),
+                'fiber': nutriments.get('fiber_100g', 0),
+                'sodium': nutriments.get('sodium_100g', 0),
+                'sugar': nutriments.get('sugars_100g', 0)
+            }
+            
+            # Check if we got meaningful data
+            if any(v > 0 for v in nutrition.values()):
+                logger.debug(f"Found nutrition data via Open Food Facts for {clean_name}")
+                return tuple(nutrition.items())
+    
+    if unanswered:
+        raise NutritionLookupUnavailable("Open Food Facts gaf geen antwoord")
+    return ()
+
+def get_ingredient_nutrition_usda(ingredient_name: str) -> Dict[str, Any]:
+    """Get nutrition data using USDA FoodData Central API."""
+    try:
+        # Copy so callers can scale the values without touching the cached lookup
+        return dict(_lookup_usda_nutrition(ingredient_name.lower().strip()))
     except Exception as e:
         logger.debug(f"USDA API error for {ingredient_name}: {e}")
+        return {}
+
+# Answered USDA searches and OpenAI explanations are also kept on disk, so they survive restarts
+_LOOKUP_CACHE_PATH = CONFIG.get("analysis", {}).get("lookup_cache_path", "cache/lookups.sqlite3")
+_LOOKUP_CACHE_TTL_SECONDS = CONFIG.get("analysis", {}).get("lookup_cache_ttl_days", 30) * 24 * 3600
+_lookup_cache_connection = None
+_lookup_cache_lock = threading.Lock()
+
+def _get_lookup_cache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk lookup cache on first use; None if it is unavailable. Call with the lock held."""
+    global _lookup_cache_connection
+
+    if _lookup_cache_connection is None:
+        try:
+            os.makedirs(os.path.dirname(_LOOKUP_CACHE_PATH) or ".", exist_ok=True)
+            connection = sqlite3.connect(_LOOKUP_CACHE_PATH, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS usda (query TEXT PRIMARY KEY, nutrition_json TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS openai_explanations (prompt_hash TEXT PRIMARY KEY, explanation TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+            connection.commit()
+            _lookup_cache_connection = connection
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Lookup cache not available, using the APIs only: {e}")
+            # Don't retry opening it for every lookup
+            _lookup_cache_connection = False
+
+    return _lookup_cache_connection or None
+
+def _read_usda_cache(query: str) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """Return a fresh cached USDA result for a query, or None."""
+    try:
+        with _lookup_cache_lock:
+            connection = _get_lookup_cache()
+            if connection is None:
+                return None
+            row = connection.execute("SELECT nutrition_json, ts FROM usda WHERE query = ?", (query,)).fetchone()
+    except sqlite3.Error as e:
+        logger.debug(f"USDA cache read failed for {query}: {e}")
+        return None
+
+    if row is None or time.time() - row[1] > _LOOKUP_CACHE_TTL_SECONDS:
+        return None
+    return tuple(json.loads(row[0]).items())
+
+def _write_usda_cache(query: str, nutrition: Tuple[Tuple[str, Any], ...]) -> None:
+    """Store an answered USDA search (also an empty one) for a query."""
+    try:
+        with _lookup_cache_lock:
+            connection = _get_lookup_cache()
+            if connection is None:
+                return
+            connection.execute(
+                "INSERT OR REPLACE INTO usda (query, nutrition_json, ts) VALUES (?, ?, ?)",
+                (query, json.dumps(dict(nutrition)), int(time.time()))
+            )
+            connection.commit()
+    except sqlite3.Error as e:
+        logger.debug(f"USDA cache write failed for {query}: {e}")
+
+@lru_cache(maxsize=2048)
+def _lookup_usda_nutrition(clean_name: str) -> Tuple[Tuple[str, Any], ...]:
+    """Search USDA FoodData Central for a cleaned name; only answered searches are cached."""
+    # Translate Dutch to English for USDA API
+    english_name = _USDA_SEARCH_TRANSLATIONS.get(clean_name, clean_name)
+    query = english_name.lower()
+
+    cached = _read_usda_cache(query)
+    if cached is not None:
+        return cached
+
+    nutrition = _search_usda_nutrition(english_name)
+    _write_usda_cache(query, nutrition)
+    return nutrition
+
+# USDA nutrient ids mapped to our nutrition fields
+_USDA_NUTRIENT_FIELDS = {
+    1008: 'calories',  # Energy (kcal)
+    1003: 'protein',   # Protein
+    1005: 'carbs',     # Carbohydrate
+    1004: 'fat',       # Total fat
+    1079: 'fiber',     # Fiber
+    1093: 'sodium',    # Sodium
+    2000: 'sugar'      # Total sugars
+}
+
+def _search_usda_nutrition(english_name: str) -> Tuple[Tuple[str, Any], ...]:
+    """Ask the USDA search API for one food; raises NutritionLookupUnavailable if it does not answer."""
+    search_url = f"https://api.nal.usda.gov/fdc/v1/foods/search"
+    params = {
+        'query': english_name,
+        'dataType': ['Foundation', 'SR Legacy'],
+        'pageSize': 1,
+        'api_key': 'DEMO_KEY'
+    }
     
-    return {}
+    response = HTTP_SESSION.get(search_url, params=params, timeout=8)
+    
+    if response.status_code != 200:
+        raise NutritionLookupUnavailable(f"USDA gaf status {response.status_code}")
 
-def get_basic_nutrition_estimates(ingredient_name: str) -> Dict[str, Any]:
-    """Provide basic nutrition estimates for common ingredients when APIs fail."""
-    clean_name = ingredient_name.lower().strip()
+    data = decode_json_response(response)
     
-    # Basic nutrition estimates per 100g for common ingredients
-    nutrition_estimates = {
-        # Vegetables
-        'ui': {'calories': 40, 'protein': 1.1, 'carbs': 9.3, 'fat': 0.1, 'fiber': 1.7},
-        'uien': {'calories': 40, 'protein': 1.1, 'carbs': 9.3, 'fat': 0.1, 'fiber': 1.7},
-        'knoflook': {'calories': 149, 'protein': 6.4, 'carbs': 33, 'fat': 0.5, 'fiber': 2.1},
-        'tomaat': {'calories': 18, 'protein': 0.9, 'carbs': 3.9, 'fat': 0.2, 'fiber': 1.2},
-        'tomaten': {'calories': 18, 'protein': 0.9, 'carbs': 3.9, 'fat': 0.2, 'fiber': 1.2},
-        'wortel': {'calories': 41, 'protein': 0.9, 'carbs': 9.6, 'fat': 0.2, 'fiber': 2.8},
-        'paprika': {'calories': 31, 'protein': 1, 'carbs': 7, 'fat': 0.3, 'fiber': 2.5},
-        'spinazie': {'calories': 23, 'protein': 2.9, 'carbs': 3.6, 'fat': 0.4, 'fiber': 2.2},
-        'peterselie': {'calories': 36, 'protein': 3, 'carbs': 6.3, 'fat': 0.8, 'fiber': 3.3},
-        'koriander': {'calories': 23, 'protein': 2.1, 'carbs': 3.7, 'fat': 0.5, 'fiber': 2.8},
-        
-        # Proteins
-        'kip': {'calories': 165, 'protein': 31, 'carbs': 0, 'fat': 3.6, 'fiber': 0},
-        'gehakt': {'calories': 250, 'protein': 26, 'carbs': 0, 'fat': 15, 'fiber': 0},
-        'burrata': {'calories': 330, 'protein': 17, 'carbs': 3, 'fat': 28, 'fiber': 0},
+    if data.get('foods') and len(data['foods']) > 0:
+        food = data['foods'][0]
+        food_nutrients = food.get('foodNutrients', [])
         
-        # Oils and fats
-        'olijfolie': {'calories': 884, 'protein': 0, 'carbs': 0, 'fat': 100, 'fiber': 0},
-        'boter': {'calories': 717, 'protein': 0.9, 'carbs': 0.1, 'fat': 81, 'fiber': 0},
+        nutrition = {
+            'calories': 0,
+            'protein': 0,
+            'carbs': 0,
+            'fat': 0,
+            'fiber': 0,
+            'sodium': 0,
+            'sugar': 0
+        }
         
-        # Sugars
-        'suiker': {'calories': 387, 'protein': 0, 'carbs': 100, 'fat': 0, 'fiber': 0},
-        'basterdsuiker': {'calories': 380, 'protein': 0, 'carbs': 98, 'fat': 0, 'fiber': 0},
+        # USDA foods list 50+ nutrients; stop once all tracked ones are read
+        found = set()
+        for nutrient in food_nutrients:
+            field = _USDA_NUTRIENT_FIELDS.get(nutrient.get('nutrientId'))
+            if field is not None:
+                nutrition[field] = round(nutrient.get('value', 0), 1)
+                found.add(field)
+                if len(found) == len(_USDA_NUTRIENT_FIELDS):
+                    break
         
-        # Grains
-        'rijst': {'calories': 130, 'protein': 2.7, 'carbs': 28, 'fat': 0.3, 'fiber': 0.4},
-        'pasta': {'calories': 131, 'protein': 5, 'carbs': 25, 'fat': 1.1, 'fiber': 1.8},
-    }
+        if any(v > 0 for v in nutrition.values()):
+            logger.debug(f"Found nutrition data via USDA for {english_name}")
+            return tuple(nutrition.items())
     
-    # Try to find exact match first
-    if clean_name in nutrition_estimates:
-        base_nutrition = nutrition_estimates[clean_name].copy()
-        base_nutrition.update({'sodium': 0, 'sugar': 0})  # Add missing keys
-        logger.debug(f"Using nutrition estimates for {ingredient_name}")
-        return base_nutrition
+    return ()
+
+# Basic nutrition estimates per 100g for common ingredients
+_BASIC_NUTRITION_ESTIMATES = {
+    # Vegetables
+    'ui': {'calories': 40, 'protein': 1.1, 'carbs': 9.3, 'fat': 0.1, 'fiber': 1.7},
+    'uien': {'calories': 40, 'protein': 1.1, 'carbs': 9.3, 'fat': 0.1, 'fiber': 1.7},
+    'knoflook': {'calories': 149, 'protein': 6.4, 'carbs': 33, 'fat': 0.5, 'fiber': 2.1},
+    'tomaat': {'calories': 18, 'protein': 0.9, 'carbs': 3.9, 'fat': 0.2, 'fiber': 1.2},
+    'tomaten': {'calories': 18, 'protein': 0.9, 'carbs': 3.9, 'fat': 0.2, 'fiber': 1.2},
+    'wortel': {'calories': 41, 'protein': 0.9, 'carbs': 9.6, 'fat': 0.2, 'fiber': 2.8},
+    'paprika': {'calories': 31, 'protein': 1, 'carbs': 7, 'fat': 0.3, 'fiber': 2.5},
+    'spinazie': {'calories': 23, 'protein': 2.9, 'carbs': 3.6, 'fat': 0.4, 'fiber': 2.2},
+    'peterselie': {'calories': 36, 'protein': 3, 'carbs': 6.3, 'fat': 0.8, 'fiber': 3.3},
+    'koriander': {'calories': 23, 'protein': 2.1, 'carbs': 3.7, 'fat': 0.5, 'fiber': 2.8},
     
-    # Try partial matches
-    for key, nutrition in nutrition_estimates.items():
-        if key in clean_name or clean_name in key:
-            base_nutrition = nutrition.copy()
-            base_nutrition.update({'sodium': 0, 'sugar': 0})
-            logger.debug(f"Using partial match nutrition estimates for {ingredient_name}")
-            return base_nutrition
+    # Proteins
+    'kip': {'calories': 165, 'protein': 31, 'carbs': 0, 'fat': 3.6, 'fiber': 0},
+    'gehakt': {'calories': 250, 'protein': 26, 'carbs': 0, 'fat': 15, 'fiber': 0},
+    'burrata': {'calories': 330, 'protein': 17, 'carbs': 3, 'fat': 28, 'fiber': 0},
+    
+    # Oils and fats
+    'olijfolie': {'calories': 884, 'protein': 0, 'carbs': 0, 'fat': 100, 'fiber': 0},
+    'boter': {'calories': 717, 'protein': 0.9, 'carbs': 0.1, 'fat': 81, 'fiber': 0},
     
+    # Sugars
+    'suiker': {'calories': 387, 'protein': 0, 'carbs': 100, 'fat': 0, 'fiber': 0},
+    'basterdsuiker': {'calories': 380, 'protein': 0, 'carbs': 98, 'fat': 0, 'fiber': 0},
+    
+    # Grains
+    'rijst': {'calories': 130, 'protein': 2.7, 'carbs': 28, 'fat': 0.3, 'fiber': 0.4},
+    'pasta': {'calories': 131, 'protein': 5, 'carbs': 25, 'fat': 1.1, 'fiber': 1.8},
+}
+
+# Partial matching follows the table order: the first key that occurs in the name, or that contains the name, wins.
+# Keys occurring in the name are found in one scan (the lookahead reports overlapping keys, earliest table key first
+# at each position); names occurring in a key are answered from an index of every key substring.
+_BASIC_NUTRITION_KEYS: Tuple[str, ...] = tuple(_BASIC_NUTRITION_ESTIMATES)
+_BASIC_NUTRITION_KEY_ORDER = {key: index for index, key in enumerate(_BASIC_NUTRITION_KEYS)}
+_BASIC_NUTRITION_KEY_RE = re.compile('(?=(' + '|'.join(map(re.escape, _BASIC_NUTRITION_KEYS)) + '))')
+
+def _index_key_substrings(keys: Tuple[str, ...]) -> Dict[str, int]:
+    """Map every substring of the keys to the position of the first key containing it."""
+    parts: Dict[str, int] = {}
+    for index, key in enumerate(keys):
+        for start in range(len(key) + 1):
+            for end in range(start, len(key) + 1):
+                parts.setdefault(key[start:end], index)
+    return parts
+
+_BASIC_NUTRITION_KEY_PARTS = _index_key_substrings(_BASIC_NUTRITION_KEYS)
+
+def _partial_nutrition_estimate_key(clean_name: str) -> Optional[str]:
+    """Return the first table key that occurs in clean_name or contains it, in table order."""
+    indices = [_BASIC_NUTRITION_KEY_ORDER[match.group(1)] for match in _BASIC_NUTRITION_KEY_RE.finditer(clean_name)]
+    part_index = _BASIC_NUTRITION_KEY_PARTS.get(clean_name)
+    if part_index is not None:
+        indices.append(part_index)
+    if not indices:
+        return None
+    return _BASIC_NUTRITION_KEYS[min(indices)]
+
+# Per-100g fallback when no estimate matches
+_DEFAULT_NUTRITION_ESTIMATE: Tuple[Tuple[str, Any], ...] = (
+    ('calories', 50), ('protein', 2), ('carbs', 10), ('fat', 1), ('fiber', 1), ('sodium', 0), ('sugar', 0)
+)
+
+@lru_cache(maxsize=8192)
+def _basic_nutrition_estimate(clean_name: str) -> Tuple[Tuple[str, Any], ...]:
+    """Look up the estimate for a cleaned name; items are returned so the cached value stays immutable."""
+    # Try to find exact match first
+    nutrition = _BASIC_NUTRITION_ESTIMATES.get(clean_name)
+    if nutrition is not None:
+        logger.debug(f"Using nutrition estimates for {clean_name}")
+        return tuple({**nutrition, 'sodium': 0, 'sugar': 0}.items())
+
+    # Try partial matches
+    key = _partial_nutrition_estimate_key(clean_name)
+    if key is not None:
+        logger.debug(f"Using partial match nutrition estimates for {clean_name}")
+        return tuple({**_BASIC_NUTRITION_ESTIMATES[key], 'sodium': 0, 'sugar': 0}.items())
+
+    # Try a close spelling ("tomatn", "knoflok"); plain ratio keeps unrelated short names out
+    fuzzy_match = process.extractOne(clean_name, _BASIC_NUTRITION_KEYS, scorer=fuzz.ratio, score_cutoff=85)
+    if fuzzy_match:
+        logger.debug(f"Using fuzzy match nutrition estimates for {clean_name}: {fuzzy_match[0]}")
+        return tuple({**_BASIC_NUTRITION_ESTIMATES[fuzzy_match[0]], 'sodium': 0, 'sugar': 0}.items())
+
     # Default values if no match
-    return {
-        'calories': 50,
-        'protein': 2,
-        'carbs': 10,
-        'fat': 1,
-        'fiber': 1,
-        'sodium': 0,
-        'sugar': 0
-    }
+    return _DEFAULT_NUTRITION_ESTIMATE
+
+def get_basic_nutrition_estimates(ingredient_name: str) -> Dict[str, Any]:
+    """Provide basic nutrition estimates for common ingredients when APIs fail."""
+    return dict(_basic_nutrition_estimate(ingredient_name.lower().strip()))
+
+# Grams per unit, used to scale the per-100g nutrition values; keys are lowercase
+_UNIT_TO_GRAMS = {
+    'gram': 1,
+    'g': 1,
+    'kilogram': 1000,
+    'kg': 1000,
+    'eetlepel': 15,  # approx 15g
+    'el': 15,
+    'theelepel': 5,  # approx 5g
+    'tl': 5,
+    'stuks': 100,    # assume average piece is 100g
+    'stuk': 100,
+    'blik': 400,     # average can
+    'pak': 250,      # average package
+    'teen': 5,       # garlic clove
+    'takje': 2,      # herb sprig
+    'snufje': 0.5    # pinch
+}
 
 def calculate_nutrition_multiplier(quantity: float, unit: str) -> float:
     """Calculate multiplier to convert from 100g base to actual quantity."""
-    # Convert different units to grams, then get ratio to 100g
-    unit_to_grams = {
-        'gram': 1,
-        'g': 1,
-        'kilogram': 1000,
-        'kg': 1000,
-        'eetlepel': 15,  # approx 15g
-        'el': 15,
-        'theelepel': 5,  # approx 5g
-        'tl': 5,
-        'stuks': 100,    # assume average piece is 100g
-        'stuk': 100,
-        'blik': 400,     # average can
-        'pak': 250,      # average package
-        'teen': 5,       # garlic clove
-        'takje': 2,      # herb sprig
-        'snufje': 0.5    # pinch
-    }
-    
-    grams = quantity * unit_to_grams.get(unit.lower(), 100)
+    # parse_ingredient_components already lowercases its units, so most lookups hit without lower()
+    unit_grams = _UNIT_TO_GRAMS.get(unit)
+    if unit_grams is None:
+        unit_grams = _UNIT_TO_GRAMS.get(unit.lower(), 100)
+
+    grams = quantity * unit_grams
     return grams / 100  # Convert to per-100g basis
 
+# Quantity/unit/name pattern for parse_ingredient_components: "500 gram verse witte asperges",
+# "500g verse witte asperges", "3 el extra vierge olijfolie" or just "22 nectarines"
+_INGREDIENT_COMPONENTS_RE = re.compile(
+    r'^(?P<quantity>\d+(?:\.\d+)?)'
+    r'(?:\s+(?P<unit>gram|kilogram|liter|milliliter|eetlepel|theelepel|stuks?|blik|pak|teen|takjes?|snufjes?)\s+'
+    r'|\s*(?P<short_unit>g|kg|l|ml|el|tl)\s+'
+    r'|\s+)'
+    r'(?P<name>.+)',
+    re.IGNORECASE
+)
+_LEADING_QUANTITY_RE = re.compile(r'^\d+(?:\.\d+)?\s*')
+_LEADING_UNIT_RE = re.compile(r'^(g|kg|l|ml|el|tl|gram|kilogram|liter|milliliter|eetlepel|theelepel)\s*', re.IGNORECASE)
+
+# Unit spellings normalized by parse_ingredient_components
+_UNIT_MAPPINGS: Dict[str, str] = {
+    'g': 'gram',
+    'kg': 'kilogram',
+    'l': 'liter',
+    'ml': 'milliliter',
+    'el': 'eetlepel',
+    'tl': 'theelepel',
+    'stuks': 'stuks',
+    'stuk': 'stuks',
+    'blik': 'blik',
+    'pak': 'pak',
+    'teen': 'teen',
+    'takje': 'takje',
+    'takjes': 'takje',
+    'snufje': 'snufje',
+    'snufjes': 'snufje'
+}
+
+@lru_cache(maxsize=8192)
 def parse_ingredient_components(ingredient_text: str) -> Tuple[Optional[float], Optional[str], str]:
     """Parse ingredient text into quantity, unit, and name components."""
 
     # Normalize fractions first
     text = ingredient_text.replace('½', '0.5')
 
-    # Common unit mappings
-    unit_mappings = {
-        'g': 'gram',
-        'kg': 'kilogram', 
-        'l': 'liter',
-        'ml': 'milliliter',
-        'el': 'eetlepel',
-        'tl': 'theelepel',
-        'stuks': 'stuks',
-        'stuk': 'stuks',
-        'blik': 'blik',
-        'pak': 'pak',
-        'teen': 'teen',
-        'takje': 'takje',
-        'takjes': 'takje',
-        'snufje': 'snufje',
-        'snufjes': 'snufje'
-    }
-
-    # Try to match quantity and unit patterns
-    patterns = [
-        # Pattern: "500 gram verse witte asperges"
-        r'^(\d+(?:\.\d+)?)\s+(gram|kilogram|liter|milliliter|eetlepel|theelepel|stuks?|blik|pak|teen|takjes?|snufjes?)\s+(.+)',
-        # Pattern: "500g verse witte asperges" 
-        r'^(\d+(?:\.\d+)?)(g|kg|l|ml|el|tl)\s+(.+)',
-        # Pattern: "3 el extra vierge olijfolie"
-        r'^(\d+(?:\.\d+)?)\s+(el|tl|g|kg|ml|l)\s+(.+)',
-        # Pattern: "22 nectarines" (just number + name)
-        r'^(\d+(?:\.\d+)?)\s+(.+)',
-    ]
-
-    for pattern in patterns:
-        match = re.match(pattern, text, re.IGNORECASE)
-        if match:
-            if len(match.groups()) == 3:
-                quantity_str, unit_str, name = match.groups()
-                # Normalize unit
-                unit = unit_mappings.get(unit_str.lower(), unit_str.lower())
-                try:
-                    quantity = float(quantity_str)
-                    return quantity, unit, name.strip()
-                except ValueError:
-                    pass
-            elif len(match.groups()) == 2:
-                quantity_str, name = match.groups()
-                try:
-                    quantity = float(quantity_str)
-                    return quantity, 'stuks', name.strip()
-                except ValueError:
-                    pass
+    # Try to match quantity and unit
+    match = _INGREDIENT_COMPONENTS_RE.match(text)
+    if match:
+        quantity = float(match.group('quantity'))
+        unit_str = match.group('unit') or match.group('short_unit')
+        name = match.group('name').strip()
+        if unit_str:
+            # Normalize unit
+            unit_str = unit_str.lower()
+            return quantity, _UNIT_MAPPINGS.get(unit_str, unit_str), name
+        return quantity, 'stuks', name
 
     # If no pattern matches, return just the clean name
-    clean_name = re.sub(r'^\d+(?:\.\d+)?\s*', '', text).strip()
-    clean_name = re.sub(r'^(g|kg|l|ml|el|tl|gram|kilogram|liter|milliliter|eetlepel|theelepel)\s*', '', clean_name, flags=re.IGNORECASE).strip()
+    clean_name = _LEADING_QUANTITY_RE.sub('', text).strip()
+    clean_name = _LEADING_UNIT_RE.sub('', clean_name).strip()
 
     return None, None, clean_name if clean_name else text.strip()
 
-def calculate_total_nutrition(ingredients: List[Dict]) -> Dict[str, float]:
-    """Calculate total nutrition from ingredients."""
+# Fixed field order of the nutrition totals tuple
+_NUTRITION_FIELDS: Tuple[str, ...] = ('calories', 'protein', 'carbs', 'fat', 'fiber')
+
+def summarize_ingredients(ingredients: List[Dict]) -> Dict[str, Any]:
+    """
+    Collect all per-ingredient aggregates in a single pass.
+
+    The result is shared by the nutrition, health goal, explanation and swap
+    functions so they don't each walk the ingredient list again.
+    """
+    calories = protein = carbs = fat = fiber = 0
+    health_score_sum = 0
+    healthy_ingredients = []
+    unhealthy_ingredients = []
+    swap_candidates = []
+
+    for ing in ingredients:
+        calories += ing.get('calories', 50)
+        protein += ing.get('protein', 2)
+        carbs += ing.get('carbs', 5)
+        fat += ing.get('fat', 1)
+        fiber += ing.get('fiber', 1)
+
+        score = ing.get('health_score', 5)
+        health_score_sum += score
+        if score >= 7:
+            healthy_ingredients.append(ing)
+        elif score <= 3:
+            unhealthy_ingredients.append(ing)
+        if score < 6:
+            swap_candidates.append(ing)
+
+    count = len(ingredients)
+    nutrition_totals = (calories, protein, carbs, fat, fiber)
     return {
-        'calories': sum(ing.get('calories', 50) for ing in ingredients),
-        'protein': sum(ing.get('protein', 2) for ing in ingredients),
-        'carbs': sum(ing.get('carbs', 5) for ing in ingredients),
-        'fat': sum(ing.get('fat', 1) for ing in ingredients),
-        'fiber': sum(ing.get('fiber', 1) for ing in ingredients)
+        'nutrition_totals': nutrition_totals,
+        'total_nutrition': dict(zip(_NUTRITION_FIELDS, nutrition_totals)),
+        'avg_health_score': health_score_sum / count if count else 5,
+        'healthy_ingredients': healthy_ingredients,
+        'unhealthy_ingredients': unhealthy_ingredients,
+        'swap_candidates': swap_candidates
     }
 
-def calculate_health_goals_scores(ingredients: List[Dict], nutrition: Dict) -> Dict[str, int]:
+def calculate_total_nutrition(ingredients: List[Dict], summary: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+    """Calculate total nutrition from ingredients."""
+    if summary is not None:
+        return dict(summary['total_nutrition'])
+
+    # Single pass over the ingredients for all nutrition fields
+    calories = protein = carbs = fat = fiber = 0
+    for ing in ingredients:
+        calories += ing.get('calories', 50)
+        protein += ing.get('protein', 2)
+        carbs += ing.get('carbs', 5)
+        fat += ing.get('fat', 1)
+        fiber += ing.get('fiber', 1)
+
+    return dict(zip(_NUTRITION_FIELDS, (calories, protein, carbs, fat, fiber)))
+
+# Health goal scores as fractions of the average ingredient health score
+_GOAL_SCORE_FACTORS: Tuple[Tuple[str, float], ...] = (
+    ('weight_loss', 0.8),
+    ('muscle_gain', 0.9),
+    ('heart_health', 1.0),
+    ('energy_boost', 0.85),
+)
+
+def calculate_health_goals_scores(ingredients: List[Dict], nutrition: Dict, summary: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
     """Calculate health goal scores."""
-    avg_health_score = sum(ing['health_score'] for ing in ingredients) / len(ingredients) if ingredients else 5
+    if summary is None:
+        summary = summarize_ingredients(ingredients)
+    avg_health_score = summary['avg_health_score']
 
-    return {
-        'weight_loss': int(avg_health_score * 0.8),
-        'muscle_gain': int(avg_health_score * 0.9),
-        'heart_health': int(avg_health_score),
-        'energy_boost': int(avg_health_score * 0.85)
-    }
+    return {goal: int(avg_health_score * factor) for goal, factor in _GOAL_SCORE_FACTORS}
+
+# OpenAI explanation calls are slow round-trips; each analysis runs its two explanations side by side
+_OPENAI_EXPLANATION_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="openai-explanation")
 
-def generate_health_explanation(ingredients: List[Dict], health_scores: Dict) -> List[str]:
+def generate_health_explanation(ingredients: List[Dict], health_scores: Dict, summary: Optional[Dict[str, Any]] = None) -> List[str]:
     """Generate health explanations with OpenAI for specific ingredient reasons."""
     explanations = []
 
@@ -1775,7 +2645,9 @@ def generate_health_explanation(ingredients: List[Dict], health_scores: Dict) ->
         explanations.append("ℹ️ Geen ingrediënten beschikbaar voor analyse.")
         return explanations
 
-    avg_score = sum(ing.get('health_score', 5) for ing in ingredients) / len(ingredients)
+    if summary is None:
+        summary = summarize_ingredients(ingredients)
+    avg_score = summary['avg_health_score']
 
     if avg_score >= 7:
         explanations.append("🌱 Dit recept bevat voornamelijk gezonde ingrediënten!")
@@ -1785,16 +2657,27 @@ def generate_health_explanation(ingredients: List[Dict], health_scores: Dict) ->
         explanations.append("⚠️ Dit recept bevat veel minder gezonde ingrediënten.")
 
     # Voeg specifieke uitleg toe over ingrediënten
-    healthy_ingredients = [ing for ing in ingredients if ing.get('health_score', 5) >= 7]
-    unhealthy_ingredients = [ing for ing in ingredients if ing.get('health_score', 5) <= 3]
+    healthy_ingredients = summary['healthy_ingredients']
+    unhealthy_ingredients = summary['unhealthy_ingredients']
+
+    # The healthy and unhealthy explanations are independent OpenAI round-trips, so request both at once
+    # Filter out hidden goals for active goals context
+    active_goals = {k: v for k, v in health_scores.items() if v > 3}  # Only include goals with decent scores
+    healthy_names = [ing.get('name', 'Onbekend') for ing in healthy_ingredients[:3]]
+    unhealthy_names = [ing.get('name', 'Onbekend') for ing in unhealthy_ingredients[:3]]
+    healthy_future = (
+        _OPENAI_EXPLANATION_EXECUTOR.submit(get_openai_ingredient_explanation, healthy_names, True, active_goals)
+        if healthy_ingredients else None
+    )
+    unhealthy_future = (
+        _OPENAI_EXPLANATION_EXECUTOR.submit(get_openai_ingredient_explanation, unhealthy_names, False, active_goals)
+        if unhealthy_ingredients else None
+    )
 
     # Get OpenAI explanations for healthy ingredients
-    if healthy_ingredients:
-        healthy_names = [ing.get('name', 'Onbekend') for ing in healthy_ingredients[:3]]
+    if healthy_future is not None:
         try:
-            # Filter out hidden goals for active goals context
-            active_goals = {k: v for k, v in health_scores.items() if v > 3}  # Only include goals with decent scores
-            healthy_explanation = get_openai_ingredient_explanation(healthy_names, True, active_goals)
+            healthy_explanation = healthy_future.result()
             explanations.append(f"✅ {healthy_explanation}")
             logger.info(f"OpenAI healthy explanation generated successfully for {len(healthy_names)} ingredients")
         except Exception as e:
@@ -1802,12 +2685,9 @@ def generate_health_explanation(ingredients: List[Dict], health_scores: Dict) ->
             explanations.append(f"✅ Gezonde ingrediënten (score 7-10): {', '.join(healthy_names)} - Deze ingrediënten zijn rijk aan vitamines, mineralen en andere gezonde voedingsstoffen.")
 
     # Get OpenAI explanations for unhealthy ingredients
-    if unhealthy_ingredients:
-        unhealthy_names = [ing.get('name', 'Onbekend') for ing in unhealthy_ingredients[:3]]
+    if unhealthy_future is not None:
         try:
-            # Filter out hidden goals for active goals context
-            active_goals = {k: v for k, v in health_scores.items() if v > 3}
-            unhealthy_explanation = get_openai_ingredient_explanation(unhealthy_names, False, active_goals)
+            unhealthy_explanation = unhealthy_future.result()
             explanations.append(f"❌ {unhealthy_explanation}")
             logger.info(f"OpenAI unhealthy explanation generated successfully for {len(unhealthy_names)} ingredients")
         except Exception as e:
@@ -1816,10 +2696,118 @@ def generate_health_explanation(ingredients: List[Dict], health_scores: Dict) ->
 
     return explanations
 
-def get_openai_ingredient_explanation(ingredient_names: List[str], is_healthy: bool, active_health_goals: Dict[str, int]) -> str:
-    """Get OpenAI explanation for why ingredients are healthy or unhealthy."""
-    import os
-    
+def _read_explanation_cache(prompt_hash: str) -> Optional[str]:
+    """Return a fresh cached OpenAI explanation for a prompt hash, or None."""
+    try:
+        with _lookup_cache_lock:
+            connection = _get_lookup_cache()
+            if connection is None:
+                return None
+            row = connection.execute(
+                "SELECT explanation, ts FROM openai_explanations WHERE prompt_hash = ?", (prompt_hash,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.debug(f"Explanation cache read failed: {e}")
+        return None
+
+    if row is None or time.time() - row[1] > _LOOKUP_CACHE_TTL_SECONDS:
+        return None
+    return row[0]
+
+def _write_explanation_cache(prompt_hash: str, explanation: str) -> None:
+    """Store an OpenAI explanation for a prompt hash."""
+    try:
+        with _lookup_cache_lock:
+            connection = _get_lookup_cache()
+            if connection is None:
+                return
+            connection.execute(
+                "INSERT OR REPLACE INTO openai_explanations (prompt_hash, explanation, ts) VALUES (?, ?, ?)",
+                (prompt_hash, explanation, int(time.time()))
+            )
+            connection.commit()
+    except sqlite3.Error as e:
+        logger.debug(f"Explanation cache write failed: {e}")
+
+# System prompt shared by the plain and the streaming explanation requests
+_EXPLANATION_SYSTEM_PROMPT = "Je bent een voedingsdeskundige die korte, accurate uitleg geeft over ingrediënten in recepten."
+
+def _stream_openai_explanation(prompt: str) -> Iterator[str]:
+    """Yield OpenAI's explanation for a prompt as it is generated; a cached answer is yielded whole."""
+    prompt_hash = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+    cached = _read_explanation_cache(prompt_hash)
+    if cached is not None:
+        yield cached
+        return
+
+    stream = get_openai_client().chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {"role": "system", "content": _EXPLANATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=120,
+        temperature=0.3,
+        timeout=15,
+        stream=True
+    )
+    parts = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if not parts and delta:
+            # Match the stripped non-streaming answer
+            delta = delta.lstrip()
+        if delta:
+            parts.append(delta)
+            yield delta
+
+    # Only a completed answer is cached
+    _write_explanation_cache(prompt_hash, "".join(parts).strip())
+
+@lru_cache(maxsize=512)
+def _request_openai_explanation(prompt: str) -> str:
+    """Ask OpenAI to explain a prompt; the prompt fully determines the request, so answers are cached by it."""
+    prompt_hash = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+    cached = _read_explanation_cache(prompt_hash)
+    if cached is not None:
+        return cached
+
+    response = get_openai_client().chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {"role": "system", "content": _EXPLANATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        max_tokens=120,
+        temperature=0.3,
+        timeout=15
+    )
+    explanation = response.choices[0].message.content.strip()
+    _write_explanation_cache(prompt_hash, explanation)
+    return explanation
+
+# Goal names as they are phrased in the OpenAI explanation prompt
+_GOAL_TRANSLATIONS: Dict[str, str] = {
+    "Algemene gezondheid": "algemene gezondheid",
+    "Hart- en vaatziekten": "hart- en vaatziekten",
+    "Diabetes preventie": "diabetes preventie",
+    "Gewichtsbeheersing": "gewichtsbeheersing",
+    "Spijsvertering": "spijsvertering",
+    "Immuunsysteem": "immuunsysteem",
+    "Botgezondheid": "botgezondheid",
+    "Energieniveau": "energieniveau",
+    "Huidgezondheid": "huidgezondheid",
+    "Hersengezondheid": "hersengezondheid",
+    "weight_loss": "gewichtsverlies",
+    "muscle_gain": "spieropbouw",
+    "heart_health": "hartgezondheid",
+    "energy_boost": "energie boost"
+}
+
+def _build_explanation_prompt(ingredient_names: List[str], is_healthy: bool, active_health_goals: Dict[str, int]) -> Tuple[str, str]:
+    """Build the OpenAI prompt and the formatted answer prefix for an ingredient explanation."""
     # Check for OpenAI API key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
@@ -1828,30 +2816,13 @@ def get_openai_ingredient_explanation(ingredient_names: List[str], is_healthy: b
 
     # Filter out hidden goals and translate keys
     visible_goals = []
-    goal_translations = {
-        "Algemene gezondheid": "algemene gezondheid",
-        "Hart- en vaatziekten": "hart- en vaatziekten", 
-        "Diabetes preventie": "diabetes preventie",
-        "Gewichtsbeheersing": "gewichtsbeheersing",
-        "Spijsvertering": "spijsvertering",
-        "Immuunsysteem": "immuunsysteem",
-        "Botgezondheid": "botgezondheid",
-        "Energieniveau": "energieniveau",
-        "Huidgezondheid": "huidgezondheid",
-        "Hersengezondheid": "hersengezondheid",
-        "weight_loss": "gewichtsverlies",
-        "muscle_gain": "spieropbouw",
-        "heart_health": "hartgezondheid",
-        "energy_boost": "energie boost"
-    }
     
     for goal, score in active_health_goals.items():
         if score > 3:  # Only include goals with decent scores
-            translated_goal = goal_translations.get(goal, goal.replace('_', ' '))
+            translated_goal = _GOAL_TRANSLATIONS.get(goal, goal.replace('_', ' '))
             visible_goals.append(translated_goal)
     
     ingredients_text = ", ".join(ingredient_names)
-    health_status = "gezond" if is_healthy else "minder gezond"
     goals_context = f"Relevante gezondheidsdoelen: {', '.join(visible_goals[:5])}" if visible_goals else ""
     
     if is_healthy:
@@ -1867,42 +2838,35 @@ Focus op voedingsstoffen, vitamines en gezondheidsvoordelen. Antwoord in het Ned
 
 Focus op waarom ze minder gezond zijn (suiker, verzadigde vetten, etc.) en geef een kort advies. Antwoord in het Nederlands."""
 
+    # Format the response properly
+    status_prefix = "Gezonde ingrediënten (score 7-10)" if is_healthy else "Minder gezonde ingrediënten (score 1-3)"
+    return prompt, f"{status_prefix}: {ingredients_text} - "
+
+def get_openai_ingredient_explanation(ingredient_names: List[str], is_healthy: bool, active_health_goals: Dict[str, int]) -> str:
+    """Get OpenAI explanation for why ingredients are healthy or unhealthy."""
+    prompt, answer_prefix = _build_explanation_prompt(ingredient_names, is_healthy, active_health_goals)
+
     try:
-        import requests
-        
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
-            "model": "gpt-3.5-turbo",
-            "messages": [
-                {"role": "system", "content": "Je bent een voedingsdeskundige die korte, accurate uitleg geeft over ingrediënten in recepten."},
-                {"role": "user", "content": prompt}
-            ],
-            "max_tokens": 120,
-            "temperature": 0.3
-        }
-        
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers=headers,
-            json=data,
-            timeout=15
-        )
-        
-        if response.status_code == 200:
-            result = response.json()
-            explanation = result['choices'][0]['message']['content'].strip()
-            
-            # Format the response properly
-            status_prefix = "Gezonde ingrediënten (score 7-10)" if is_healthy else "Minder gezonde ingrediënten (score 1-3)"
-            return f"{status_prefix}: {ingredients_text} - {explanation}"
-        else:
-            logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
-            raise Exception(f"OpenAI API fout: HTTP {response.status_code}")
-        
+        return answer_prefix + _request_openai_explanation(prompt)
+
+    except Exception as e:
+        logger.error(f"OpenAI API call failed: {e}")
+        # Re-raise to be handled by calling function
+        raise Exception(f"OpenAI API aanroep mislukt: {str(e)}")
+
+def get_openai_ingredient_explanation_stream(ingredient_names: List[str], is_healthy: bool, active_health_goals: Dict[str, int]) -> Iterator[str]:
+    """
+    Stream the ingredient explanation as it is generated.
+
+    The first chunk is the same answer prefix get_openai_ingredient_explanation
+    uses, so the /explain-ingredients-stream endpoint can send it right away.
+    """
+    prompt, answer_prefix = _build_explanation_prompt(ingredient_names, is_healthy, active_health_goals)
+    yield answer_prefix
+
+    try:
+        yield from _stream_openai_explanation(prompt)
+
     except Exception as e:
         logger.error(f"OpenAI API call failed: {e}")
         # Re-raise to be handled by calling function
@@ -1951,17 +2915,14 @@ def analyse_text_directly(text: str) -> Dict[str, Any]:
         logger.info(f"Found {len(ingredients)} ingredients in text")
 
         # Process ingredients the same way as URL analysis
-        all_ingredients = []
-        for ingredient_text in ingredients:
-            ingredient_data = analyze_ingredient(ingredient_text.strip())
-            if ingredient_data:
-                all_ingredients.append(ingredient_data)
+        all_ingredients = analyze_ingredients(ingredients)
 
         # Calculate nutrition and health scores
-        total_nutrition = calculate_total_nutrition(all_ingredients)
-        health_goals_scores = calculate_health_goals_scores(all_ingredients, total_nutrition)
-        health_explanation = generate_health_explanation(all_ingredients, health_goals_scores)
-        swaps = generate_healthier_swaps(all_ingredients)
+        summary = summarize_ingredients(all_ingredients)
+        total_nutrition = calculate_total_nutrition(all_ingredients, summary)
+        health_goals_scores = calculate_health_goals_scores(all_ingredients, total_nutrition, summary)
+        health_explanation = generate_health_explanation(all_ingredients, health_goals_scores, summary)
+        swaps = generate_healthier_swaps(summary['swap_candidates'])
 
         result = {
             "success": True,
@@ -1982,84 +2943,101 @@ def analyse_text_directly(text: str) -> Dict[str, Any]:
         logger.error(f"Text analysis failed: {e}")
         raise
 
-def analyse(url_or_text: str) -> Dict[str, Any]:
+def _analysis_cache_key(url_or_text: str, is_url: bool) -> str:
+    """Build the result cache key: the URL itself, or a hash of the text."""
+    if is_url:
+        return f"url:{url_or_text}"
+    return "text:" + hashlib.sha256(url_or_text.strip().encode("utf-8")).hexdigest()
+
+def analyse(url_or_text: str, refresh: bool = False) -> Dict[str, Any]:
     """
     Main analysis function that coordinates the entire recipe analysis process.
 
+    Results are cached per URL (or per text) so repeated requests for the
+    same recipe skip scraping, nutrition lookups and OpenAI calls.
+
     Args:
         url_or_text (str): URL of the recipe page or direct text to analyze
+        refresh (bool): Bypass the result cache and analyse again
 
     Returns:
         Dict[str, Any]: Complete analysis results including ingredients, 
                        nutrition, health scores, and recommendations
     """
+    # Check once whether input is URL or direct text
+    is_url = url_or_text.startswith(('http://', 'https://'))
+    cache_key = _analysis_cache_key(url_or_text, is_url)
+
+    if not refresh:
+        cached_result = _ANALYSIS_CACHE.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"Returning cached analysis for {url_or_text[:50]}...")
+            return copy.deepcopy(cached_result)
+
+    result = _analyse_uncached(url_or_text, is_url, refresh)
+    _ANALYSIS_CACHE.store(cache_key, result)
+
+    # Callers may mutate the result, so never hand out the cached object
+    return copy.deepcopy(result)
+
+def _analyse_uncached(url_or_text: str, is_url: bool, refresh: bool = False) -> Dict[str, Any]:
+    """Run the full analysis pipeline without consulting the result cache."""
     logger.info(f"Starting analysis for {url_or_text[:50]}...")
 
-    # Check if input is URL or direct text
-    if url_or_text.startswith(('http://', 'https://')):
+    if is_url:
         # Extract ingredients from URL
-        ingredients_list, recipe_title = smart_ingredient_scraping(url_or_text)
+        ingredients_list, recipe_title = smart_ingredient_scraping(url_or_text, refresh=refresh)
     else:
+        # Reject input without any words before doing expensive work
+        if not any(ch.isalpha() for ch in url_or_text[:512]):
+            raise Exception("Geen ingrediënten gevonden. De tekst bevat geen leesbare woorden.")
+
         # Extract ingredients from direct text
         logger.info("Processing direct text input")
         ingredients_list = extract_ingredients_from_text(url_or_text)
         recipe_title = "Tekst Analyse"
 
-    if not ingredients_list or len(ingredients_list) < 3:
+    if not ingredients_list or len(ingredients_list) < _MIN_INGREDIENTS:
         raise Exception("Geen ingrediënten gevonden. Controleer of dit een receptpagina is of dat de tekst ingrediënten bevat.")
 
     # Process each ingredient
-    all_ingredients = []
-    for ingredient_text in ingredients_list:
-        ingredient_data = analyze_ingredient(ingredient_text.strip())
-        if ingredient_data:
-            all_ingredients.append(ingredient_data)
-
-    # Calculate overall metrics
-    total_nutrition = calculate_total_nutrition(all_ingredients)
-    health_goals_scores = calculate_health_goals_scores(all_ingredients, total_nutrition)
-
-    # Ensure all standard health goals are present
-    standard_goals = {
-        "Algemene gezondheid": 5,
-        "Hart- en vaatziekten": 5,
-        "Diabetes preventie": 5,
-        "Gewichtsbeheersing": 5,
-        "Spijsvertering": 5,
-        "Immuunsysteem": 5,
-        "Botgezondheid": 5,
-        "Energieniveau": 5,
-        "Huidgezondheid": 5,
-        "Hersengezondheid": 5
-    }
+    all_ingredients = analyze_ingredients(ingredients_list)
+
+    if len(all_ingredients) < _MIN_INGREDIENTS:
+        raise Exception("Geen ingrediënten genoeg over na verwerking. Controleer of dit een receptpagina is of dat de tekst ingrediënten bevat.")
 
-    # Update with calculated scores, keeping standard goals that weren't calculated
-    for goal, default_score in standard_goals.items():
-        if goal not in health_goals_scores:
-            health_goals_scores[goal] = default_score
+    # Calculate overall metrics in a single pass over the ingredients
+    summary = summarize_ingredients(all_ingredients)
+    total_nutrition = calculate_total_nutrition(all_ingredients, summary)
+    health_goals_scores = calculate_health_goals_scores(all_ingredients, total_nutrition, summary)
 
-    # Ensure Algemene gezondheid is first
-    ordered_goals = {"Algemene gezondheid": health_goals_scores.pop("Algemene gezondheid", 5)}
+    # Ensure Algemene gezondheid is first, followed by the calculated scores
+    # and any standard goals that weren't calculated
+    ordered_goals = {_PRIMARY_GOAL: health_goals_scores.get(_PRIMARY_GOAL, _STANDARD_GOALS_DICT[_PRIMARY_GOAL])}
     ordered_goals.update(health_goals_scores)
+    for goal, default_score in _STANDARD_GOALS:
+        ordered_goals.setdefault(goal, default_score)
     health_goals_scores = ordered_goals
 
-    # Calculate overall health score
-    health_score = sum(health_goals_scores[goal] * 0.1 for goal in health_goals_scores)
+    # Calculate overall health score as the mean of all goal scores
+    health_score = round(fmean(health_goals_scores.values()), 1) if health_goals_scores else 5.0
 
     # Get health explanation
-    health_explanation = generate_health_explanation(all_ingredients, health_goals_scores)
+    health_explanation = generate_health_explanation(all_ingredients, health_goals_scores, summary)
 
     # Generate health score explanation
     health_score_explanation = generate_health_score_explanation(
-        health_score, total_nutrition, all_ingredients, health_goals_scores
+        health_score, total_nutrition, all_ingredients, health_goals_scores,
+        healthy_ingredients_count=len(summary['healthy_ingredients']),
+        nutrition_totals=summary['nutrition_totals']
     )
 
-    swaps = generate_healthier_swaps(all_ingredients)
+    swaps = generate_healthier_swaps(summary['swap_candidates'])
 
     result = {
         "success": True,
         "recipe_title": recipe_title or "Recept Analyse",
-        "source": "url" if url_or_text.startswith(('http://', 'https://')) else "text",
+        "source": "url" if is_url else "text",
         "all_ingredients": all_ingredients or [],
         "total_nutrition": total_nutrition or {},
         "health_goals_scores": health_goals_scores or {},
@@ -2073,31 +3051,6 @@ def analyse(url_or_text: str) -> Dict[str, Any]:
     logger.info(f"Analysis completed successfully: {len(all_ingredients)} ingredients, health score: {health_score:.1f}")
     return result
 
-if __name__ == "__main__":
-    """
-    Command line interface for testing recipe analysis.
-
-    Usage:
-        python analyse.py <recipe_url>
-    """
-    import sys
-    import pprint
-    import os
-    import openai
-    openai.api_key = os.getenv("OPENAI_API_KEY")
-
-    if len(sys.argv) != 2:
-        print("Usage: python analyse.py <recipe_url>")
-        sys.exit(1)
-
-    try:
-        result = analyse(sys.argv[1])
-        pprint.pprint(result)
-    except Exception as e:
-        print(f"Analysis failed: {e}")
-        sys.exit(1)
-
-
 def calculate_portions(ingredients: List[Dict], target_portions: int, original_portions: int = 4) -> List[Dict]:
     """
     Calculate ingredient quantities for different number of portions.
@@ -2117,8 +3070,6 @@ def calculate_portions(ingredients: List[Dict], target_portions: int, original_p
     adjusted_ingredients = []
 
     for ingredient in ingredients:
-        adjusted_ingredient = ingredient.copy()
-
         if ingredient.get('quantity') is not None:
             original_quantity = ingredient['quantity']
             new_quantity = original_quantity * portion_multiplier
@@ -2126,27 +3077,34 @@ def calculate_portions(ingredients: List[Dict], target_portions: int, original_p
             # Round to reasonable precision
             if new_quantity < 1:
                 # For small amounts, round to 1 decimal place
-                adjusted_ingredient['quantity'] = round(new_quantity, 1)
+                new_quantity = round(new_quantity, 1)
             elif new_quantity < 10:
                 # For medium amounts, round to nearest 0.5
-                adjusted_ingredient['quantity'] = round(new_quantity * 2) / 2
+                new_quantity = round(new_quantity * 2) / 2
             else:
                 # For large amounts, round to nearest whole number
-                adjusted_ingredient['quantity'] = round(new_quantity)
+                new_quantity = round(new_quantity)
 
             # Update display text
-            if adjusted_ingredient['quantity'] and adjusted_ingredient.get('unit'):
-                adjusted_ingredient['display_text'] = f"{adjusted_ingredient['quantity']} {adjusted_ingredient['unit']} {adjusted_ingredient['name']}"
+            if new_quantity and ingredient.get('unit'):
+                display_text = f"{new_quantity} {ingredient['unit']} {ingredient['name']}"
             else:
-                adjusted_ingredient['display_text'] = adjusted_ingredient['name']
+                display_text = ingredient['name']
+
+            # Layer the changed fields over the original in a single build
+            adjusted_ingredient = {**ingredient, 'quantity': new_quantity, 'display_text': display_text}
         else:
             # No quantity info, keep as-is
-            adjusted_ingredient['display_text'] = adjusted_ingredient['name']
+            adjusted_ingredient = {**ingredient, 'display_text': ingredient['name']}
 
         adjusted_ingredients.append(adjusted_ingredient)
 
     return adjusted_ingredients
 
+# Main protein sources (substring match) and the units their weight is given in
+_PROTEIN_KEYWORDS = ('vlees', 'kip', 'vis', 'gehakt', 'burrata', 'kaas')
+_GRAM_UNITS = frozenset(('gram', 'g'))
+
 def detect_recipe_portions(ingredients: List[Dict]) -> int:
     """
     Try to detect how many portions a recipe is for based on ingredient quantities.
@@ -2158,7 +3116,8 @@ def detect_recipe_portions(ingredients: List[Dict]) -> int:
         Estimated number of portions (default 4 if unclear)
     """
     # Look for clues in quantities - this is a simple heuristic
-    protein_quantities = []
+    protein_sum = 0.0
+    protein_count = 0
 
     for ingredient in ingredients:
         name_lower = ingredient.get('name', '').lower()
@@ -2166,12 +3125,13 @@ def detect_recipe_portions(ingredients: List[Dict]) -> int:
         unit = ingredient.get('unit', '').lower()
 
         # Look for main protein sources and their typical quantities
-        if quantity and unit in ['gram', 'g']:
-            if any(protein in name_lower for protein in ['vlees', 'kip', 'vis', 'gehakt', 'burrata', 'kaas']):
-                protein_quantities.append(quantity)
+        if quantity and unit in _GRAM_UNITS:
+            if any(protein in name_lower for protein in _PROTEIN_KEYWORDS):
+                protein_sum += quantity
+                protein_count += 1
 
-    if protein_quantities:
-        avg_protein = sum(protein_quantities) / len(protein_quantities)
+    if protein_count:
+        avg_protein = protein_sum / protein_count
 
         # Rough estimation based on protein amounts
         if avg_protein < 150:
@@ -2186,10 +3146,35 @@ def detect_recipe_portions(ingredients: List[Dict]) -> int:
     # Default to 4 portions if we can't determine
     return 4
 
+# Fallback English to Dutch translations for common ingredients
+_SIMPLE_TRANSLATIONS: Mapping[str, str] = MappingProxyType({
+    'flour': 'bloem',
+    'sugar': 'suiker', 
+    'butter': 'boter',
+    'eggs': 'eieren',
+    'milk': 'melk',
+    'oil': 'olie',
+    'salt': 'zout',
+    'pepper': 'peper',
+    'chicken': 'kip',
+    'beef': 'rundvlees',
+    'pork': 'varkensvlees',
+    'onion': 'ui',
+    'garlic': 'knoflook',
+    'tomato': 'tomaat',
+    'carrot': 'wortel',
+    'potato': 'aardappel'
+})
+
 def translate_to_dutch(text):
     """Translate text to Dutch using OpenAI"""
+    # Common ingredients don't need an API call
+    simple_translation = _SIMPLE_TRANSLATIONS.get(text.lower())
+    if simple_translation:
+        return simple_translation
+
     try:
-        response = openai.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "Je bent een professionele vertaler voor voedingsingrediënten. Vertaal de gegeven ingrediëntnaam naar het Nederlands. Gebruik Nederlandse culinaire termen. Geef alleen de Nederlandse naam terug, geen uitleg of extra tekst."},
@@ -2204,26 +3189,7 @@ def translate_to_dutch(text):
         if translation and translation.lower() != text.lower():
             return translation
         else:
-            # Fallback to simple dictionary for common ingredients
-            simple_translations = {
-                'flour': 'bloem',
-                'sugar': 'suiker', 
-                'butter': 'boter',
-                'eggs': 'eieren',
-                'milk': 'melk',
-                'oil': 'olie',
-                'salt': 'zout',
-                'pepper': 'peper',
-                'chicken': 'kip',
-                'beef': 'rundvlees',
-                'pork': 'varkensvlees',
-                'onion': 'ui',
-                'garlic': 'knoflook',
-                'tomato': 'tomaat',
-                'carrot': 'wortel',
-                'potato': 'aardappel'
-            }
-            return simple_translations.get(text.lower(), text)
+            return text
 
     except Exception as e:
         logger.error(f"Translation error: {e}")
@@ -2232,25 +3198,11 @@ def translate_to_dutch(text):
 def calculate_overall_health_score(health_goals_scores: Dict[str, int]) -> float:
     """Calculate an overall health score from health goal scores."""
     try:
-        # Define weights for each health goal
-        weights = {
-            "Algemene gezondheid": 0.25,
-            "Hart- en vaatziekten": 0.15,
-            "Diabetes preventie": 0.15,
-            "Gewichtsbeheersing": 0.10,
-            "Spijsvertering": 0.05,
-            "Immuunsysteem": 0.05,
-            "Botgezondheid": 0.05,
-            "Energieniveau": 0.10,
-            "Huidgezondheid": 0.05,
-            "Hersengezondheid": 0.05
-        }
-
         # Calculate weighted sum of health goal scores
-        weighted_sum = sum(health_goals_scores[goal] * weights.get(goal, 0) for goal in health_goals_scores)
+        weighted_sum = sum(score * _GOAL_WEIGHTS.get(goal, 0) for goal, score in health_goals_scores.items())
 
         # Normalize to a 1-10 scale
-        overall_health_score = weighted_sum / sum(weights.values()) if weights else 5
+        overall_health_score = weighted_sum / _GOAL_WEIGHTS_TOTAL if _GOAL_WEIGHTS_TOTAL else 5
 
         return round(overall_health_score, 1)
 
@@ -2275,54 +3227,99 @@ def get_health_explanation(ingredients: List[Dict]) -> List[str]:
         logger.error(f"Error getting health explanation: {e}")
         return ["Geen uitleg beschikbaar"]
 
-def generate_health_score_explanation(health_score, total_nutrition, all_ingredients, health_goals_scores):
+# Dutch display names for health goal keys in the score explanation
+_HEALTH_GOAL_DISPLAY_NAMES: Dict[str, str] = {
+    "Algemene gezondheid": "Algemene gezondheid",
+    "Hart- en vaatziekten": "Hart- en vaatziekten",
+    "Diabetes preventie": "Diabetes preventie",
+    "Gewichtsbeheersing": "Gewichtsbeheersing",
+    "Spijsvertering": "Spijsvertering",
+    "Immuunsysteem": "Immuunsysteem",
+    "Botgezondheid": "Botgezondheid",
+    "Energieniveau": "Energieniveau",
+    "Huidgezondheid": "Huidgezondheid",
+    "Hersengezondheid": "Hersengezondheid",
+    "weight_loss": "Gewichtsverlies",
+    "muscle_gain": "Spieropbouw",
+    "heart_health": "Hartgezondheid",
+    "energy_boost": "Energie boost"
+}
+
+_HEALTH_SCORE_EXPLANATION_TEMPLATE = """De gezondheidsscore van {health_score}/10 is berekend op basis van een uitgebreide analyse van alle ingrediënten en hun voedingswaarden. 
+
+Per portie bevat dit recept ongeveer {calories} calorieën, {protein}g eiwitten, {carbs}g koolhydraten, {fat}g vetten en {fiber}g vezels. Van de {total_ingredients} ingrediënten werden er {healthy_ingredients_count} als gezond beoordeeld (score 7+/10). 
+
+De dagelijkse hoeveelheid voedingsstoffen werd vergeleken met aanbevolen dagelijkse waarden, waarbij rekening werd gehouden met de hoeveelheid vezels (goed voor spijsvertering), het type vetten (verzadigd vs onverzadigd), en de aanwezigheid van vitamines en mineralen. 
+
+De hoogste scores werden behaald voor {goal_1_name} ({goal_1_score}/10), {goal_2_name} ({goal_2_score}/10) en {goal_3_name} ({goal_3_score}/10). Deze score geeft een indicatie van hoe goed dit recept past binnen een gezond voedingspatroon."""
+
+def generate_health_score_explanation(health_score, total_nutrition, all_ingredients, health_goals_scores, healthy_ingredients_count=None, nutrition_totals=None):
     """Generate explanation for how the health score was calculated"""
     try:
-        # Prepare nutrition summary
-        calories = total_nutrition.get('calories', 0)
-        protein = total_nutrition.get('protein', 0)
-        carbs = total_nutrition.get('carbs', 0)
-        fat = total_nutrition.get('fat', 0)
-        fiber = total_nutrition.get('fiber', 0)
+        # Prepare nutrition summary, preferring the precomputed totals tuple
+        if nutrition_totals is None:
+            nutrition_totals = tuple(total_nutrition.get(field, 0) for field in _NUTRITION_FIELDS)
+        calories, protein, carbs, fat, fiber = nutrition_totals
 
         # Count healthy vs unhealthy ingredients
-        healthy_ingredients = len([i for i in all_ingredients if i.get('health_score', 0) >= 7])
-        total_ingredients = len(all_ingredients)
+        if healthy_ingredients_count is None:
+            healthy_ingredients_count = len([i for i in all_ingredients if i.get('health_score', 0) >= 7])
 
         # Get top health goal scores and translate keys to Dutch
-        health_goals_translations = {
-            "Algemene gezondheid": "Algemene gezondheid",
-            "Hart- en vaatziekten": "Hart- en vaatziekten", 
-            "Diabetes preventie": "Diabetes preventie",
-            "Gewichtsbeheersing": "Gewichtsbeheersing",
-            "Spijsvertering": "Spijsvertering",
-            "Immuunsysteem": "Immuunsysteem",
-            "Botgezondheid": "Botgezondheid",
-            "Energieniveau": "Energieniveau",
-            "Huidgezondheid": "Huidgezondheid",
-            "Hersengezondheid": "Hersengezondheid",
-            "weight_loss": "Gewichtsverlies",
-            "muscle_gain": "Spieropbouw",
-            "heart_health": "Hartgezondheid",
-            "energy_boost": "Energie boost"
-        }
-        
-        top_goals = sorted(health_goals_scores.items(), key=lambda x: x[1], reverse=True)[:3]
-        translated_goals = []
-        for goal_key, score in top_goals:
-            translated_name = health_goals_translations.get(goal_key, goal_key)
-            translated_goals.append((translated_name, score))
+        top_goals = heapq.nlargest(3, health_goals_scores.items(), key=itemgetter(1))
+        translated_goals = [(_HEALTH_GOAL_DISPLAY_NAMES.get(goal_key, goal_key), score) for goal_key, score in top_goals]
+
+        explanation = _HEALTH_SCORE_EXPLANATION_TEMPLATE.format(
+            health_score=health_score,
+            calories=calories,
+            protein=protein,
+            carbs=carbs,
+            fat=fat,
+            fiber=fiber,
+            total_ingredients=len(all_ingredients),
+            healthy_ingredients_count=healthy_ingredients_count,
+            goal_1_name=translated_goals[0][0],
+            goal_1_score=translated_goals[0][1],
+            goal_2_name=translated_goals[1][0],
+            goal_2_score=translated_goals[1][1],
+            goal_3_name=translated_goals[2][0],
+            goal_3_score=translated_goals[2][1]
+        )
 
-        explanation = f"""De gezondheidsscore van {health_score}/10 is berekend op basis van een uitgebreide analyse van alle ingrediënten en hun voedingswaarden. 
+        return explanation.strip()
 
-Per portie bevat dit recept ongeveer {calories} calorieën, {protein}g eiwitten, {carbs}g koolhydraten, {fat}g vetten en {fiber}g vezels. Van de {total_ingredients} ingrediënten werden er {healthy_ingredients} als gezond beoordeeld (score 7+/10). 
+    except Exception as e:
+        logger.error(f"Error generating health score explanation: {e}")
+        return "Er kon geen uitleg gegenereerd worden voor de gezondheidsscore."
 
-De dagelijkse hoeveelheid voedingsstoffen werd vergeleken met aanbevolen dagelijkse waarden, waarbij rekening werd gehouden met de hoeveelheid vezels (goed voor spijsvertering), het type vetten (verzadigd vs onverzadigd), en de aanwezigheid van vitamines en mineralen. 
+if __name__ == "__main__":
+    """
+    Command line interface for testing recipe analysis.
 
-De hoogste scores werden behaald voor {translated_goals[0][0]} ({translated_goals[0][1]}/10), {translated_goals[1][0]} ({translated_goals[1][1]}/10) en {translated_goals[2][0]} ({translated_goals[2][1]}/10). Deze score geeft een indicatie van hoe goed dit recept past binnen een gezond voedingspatroon."""
+    Usage:
+        python analyse.py [--pretty] <recipe_url>
 
-        return explanation.strip()
+    Prints the result as JSON, or with pprint when --pretty is given.
+    """
+    import sys
+    import pprint
+
+    pretty = '--pretty' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--pretty']
+
+    if len(args) != 1:
+        print("Usage: python analyse.py [--pretty] <recipe_url>")
+        sys.exit(1)
 
+    try:
+        result = analyse(args[0])
     except Exception as e:
-        logger.error(f"Error generating health score explanation: {e}")
-        return "Er kon geen uitleg gegenereerd worden voor de gezondheidsscore."
\ No newline at end of file
+        print(f"Analysis failed: {e}")
+        sys.exit(1)
+
+    if pretty:
+        pprint.pprint(result)
+    elif ORJSON_AVAILABLE:
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -1,14 +1,14 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.concurrency import run_in_threadpool, iterate_in_threadpool
 import time
 import logging
 import json
 import os
-import requests
-from analyse import analyse
+from analyse import analyse, HTTP_SESSION, decode_json_response, get_openai_ingredient_explanation_stream
 from urllib.parse import urlparse
 from chrome_extension_api import setup_chrome_extension_api
 from debug_helper import debug
@@ -189,7 +189,7 @@ async def analyse_endpoint(request: Request, url: str):
 
     try:
         logger.info(f"Analysing recipe from {url} for {client_ip}")
-        result = analyse(url)
+        result = await run_in_threadpool(analyse, url)
         logger.info(f"Analysis successful for {client_ip}")
         return result
 
@@ -278,7 +278,7 @@ async def analyse_text_endpoint(request: Request):
 
     try:
         logger.info(f"Analysing recipe from text for {client_ip}")
-        result = analyse(text)
+        result = await run_in_threadpool(analyse, text)
         logger.info(f"Analysis successful for {client_ip}")
         return result
 
@@ -477,6 +477,23 @@ async def explain_healthy_ingredients(ingredients: str):
     """Generate AI explanation for healthy ingredients"""
     return await get_ai_explanation(ingredients, "healthy")
 
+@app.get("/explain-ingredients-stream")
+async def explain_ingredients_stream(ingredients: str, healthy: bool = True):
+    """Stream the AI explanation for ingredients while OpenAI generates it"""
+    ingredient_names = [name.strip() for name in ingredients.split(',') if name.strip()]
+    return StreamingResponse(
+        iterate_in_threadpool(stream_ingredient_explanation(ingredient_names, healthy)),
+        media_type="text/plain; charset=utf-8"
+    )
+
+def stream_ingredient_explanation(ingredient_names, healthy: bool):
+    """Yield explanation chunks, ending with a fallback message if OpenAI fails"""
+    try:
+        yield from get_openai_ingredient_explanation_stream(ingredient_names, healthy, {})
+    except Exception as e:
+        logger.error(f"Streaming explanation error: {e}")
+        yield "Deze ingrediënten zijn rijk aan vitaminen en mineralen." if healthy else "Een voedingsexpert zou u adviseren om deze ingrediënten in balans te houden met veel groenten en fruit."
+
 @app.get("/ingredient-substitutions")
 async def get_ingredient_substitutions(name: str):
     """Get AI-generated substitutions for unhealthy ingredients"""
@@ -508,7 +525,8 @@ async def get_ingredient_substitutions(name: str):
             "temperature": 0.8
         }
 
-        response = requests.post(
+        response = await run_in_threadpool(
+            HTTP_SESSION.post,
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=data,
@@ -516,7 +534,7 @@ async def get_ingredient_substitutions(name: str):
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = decode_json_response(response)
             substitutions_text = result['choices'][0]['message']['content'].strip()
             substitutions = [s.strip() for s in substitutions_text.split(',')]
             return {"substitutions": substitutions}
@@ -572,7 +590,8 @@ async def get_ingredient_description(name: str, healthy: bool = True):
             "temperature": 0.7
         }
 
-        response = requests.post(
+        response = await run_in_threadpool(
+            HTTP_SESSION.post,
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=data,
@@ -580,7 +599,7 @@ async def get_ingredient_description(name: str, healthy: bool = True):
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = decode_json_response(response)
             description = result['choices'][0]['message']['content'].strip()
             return {"description": description, "nutrition": nutrition_data}
         else:
@@ -598,9 +617,9 @@ async def get_nutrition_from_openfoodfacts(ingredient_name: str):
         clean_name = ingredient_name.lower().strip()
         search_url = f"https://world.openfoodfacts.org/cgi/search.pl?search_terms={clean_name}&search_simple=1&action=process&json=1"
 
-        response = requests.get(search_url, timeout=5)
+        response = await run_in_threadpool(HTTP_SESSION.get, search_url, timeout=5)
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json_response(response)
 
             if data.get('products') and len(data['products']) > 0:
                 product = data['products'][0]
@@ -675,7 +694,8 @@ async def get_ai_explanation(ingredients: str, explanation_type: str):
             "temperature": 0.7
         }
 
-        response = requests.post(
+        response = await run_in_threadpool(
+            HTTP_SESSION.post,
             "https://api.openai.com/v1/chat/completions",
             headers=headers,
             json=data,
@@ -683,7 +703,7 @@ async def get_ai_explanation(ingredients: str, explanation_type: str):
         )
 
         if response.status_code == 200:
-            result = response.json()
+            result = decode_json_response(response)
             explanation = result['choices'][0]['message']['content'].strip()
             return {"explanation": explanation}
         else:
@@ -1,6 +1,7 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 import json
 import logging
 from typing import Dict, Any
@@ -24,7 +25,7 @@ def setup_chrome_extension_api(app: FastAPI):
     async def chrome_analyze(url: str):
         """Chrome extension analysis endpoint"""
         try:
-            result = analyse(url)
+            result = await run_in_threadpool(analyse, url)
             
             # Return simplified data for chrome extension
             return {
@@ -78,7 +79,7 @@ class ChromeExtensionAPI:
                 if not url or len(url) < 10:
                     raise HTTPException(400, "Invalid URL")
                 
-                result = analyse(url)
+                result = await run_in_threadpool(analyse, url)
                 
                 # Format for extension
                 extension_result = {
@@ -107,7 +108,7 @@ class ChromeExtensionAPI:
             """Quick health check for extension badge"""
             try:
                 # Simplified analysis for badge
-                result = analyse(url)
+                result = await run_in_threadpool(analyse, url)
                 health_score = result.get("health_score", 5)
                 
                 return {
@@ -129,7 +130,7 @@ class ChromeExtensionAPI:
         async def get_suggestions(url: str):
             """Get improvement suggestions for extension popup"""
             try:
-                result = analyse(url)
+                result = await run_in_threadpool(analyse, url)
                 suggestions = []
                 
                 # Generate suggestions based on analysis
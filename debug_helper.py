@@ -387,9 +387,9 @@ class DebugHelper:
         if self.debug_enabled:
             logger.debug(f"HTTP response {response.status_code} in {duration:.2f}s")
     
-    def save_debug_html(self, html_content: str, url: str, method: str):
-        """Save debug HTML for analysis"""
-        if self.debug_enabled:
+    def save_debug_html(self, html_content, url: str, method: str):
+        """Save debug HTML for analysis, as text or as the raw response bytes"""
+        if self.debug_enabled and logger.isEnabledFor(logging.DEBUG):
             try:
                 import os
                 from urllib.parse import urlparse
@@ -402,9 +402,13 @@ class DebugHelper:
                 timestamp = int(time.time())
                 filename = f"debug/debug_html_{domain}_{method}_{timestamp}.html"
                 
-                # Save HTML content
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
+                # Save HTML content, raw bytes as-is so nothing is re-encoded
+                if isinstance(html_content, bytes):
+                    with open(filename, 'wb') as f:
+                        f.write(html_content)
+                else:
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(html_content)
                     
                 logger.debug(f"Saved debug HTML to {filename}")
             except Exception as e: